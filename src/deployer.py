@@ -8,20 +8,110 @@ Requires:
 
 import logging
 import os
+import random
 import subprocess
+import threading
 import time
+from collections import deque
 
 logger = logging.getLogger(__name__)
 
-_MAX_ATTEMPTS = 3
-_RETRY_DELAY  = 20  # seconds between attempts
+_MAX_ATTEMPTS     = 3
+_RETRY_BASE_DELAY = 2    # seconds; doubled on each attempt
+_RETRY_MAX_DELAY  = 60   # seconds
+_RETRY_JITTER     = 0.5  # up to +50% random jitter
+_DEPLOY_TIMEOUT   = 120  # seconds per attempt
+_OUTPUT_TAIL      = 200  # wrangler output lines kept for error inspection
+
+# wrangler output fragments that mean retrying cannot help (auth/config errors)
+_UNRECOVERABLE = (
+    "Unauthorized",
+    "Invalid API token",
+    "Forbidden",
+    "project not found",
+    "ENOENT",
+)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter after the given (1-based) failed attempt."""
+    delay = _RETRY_BASE_DELAY * (2 ** (attempt - 1)) * (1 + random.uniform(0, _RETRY_JITTER))
+    return min(_RETRY_MAX_DELAY, delay)
+
+
+def _run_wrangler_version() -> None:
+    try:
+        subprocess.run(["wrangler", "--version"], capture_output=True, timeout=10)
+    except Exception as e:
+        logger.debug(f"wrangler warm-up failed: {e}")
+
+
+def warm_up_wrangler() -> threading.Thread:
+    """
+    Invoke `wrangler --version` in a background thread so the node runtime and
+    wrangler package are in the OS page cache before the real deploy runs.
+
+    Returns:
+        The started daemon thread (callers need not join it)
+    """
+    thread = threading.Thread(target=_run_wrangler_version, name="wrangler-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def _run_streaming(cmd: list[str], env: dict, timeout: float) -> tuple[int, str]:
+    """
+    Run a command, logging its combined stdout/stderr line by line as it arrives.
+
+    A watchdog kills the process after `timeout` seconds.
+
+    Returns:
+        (exit code, last _OUTPUT_TAIL lines of output)
+
+    Raises:
+        subprocess.TimeoutExpired if the watchdog fired
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=env,
+    )
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    watchdog = threading.Timer(timeout, _kill)
+    watchdog.daemon = True
+    watchdog.start()
+    tail: deque[str] = deque(maxlen=_OUTPUT_TAIL)
+    try:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line:
+                logger.info(f"wrangler: {line}")
+                tail.append(line)
+        returncode = proc.wait()
+    finally:
+        watchdog.cancel()
+        proc.stdout.close()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return returncode, "\n".join(tail)
 
 
 def deploy_site(site_dir: str, project_name: str, account_id: str = None) -> bool:
     """
     Deploy the built site to Cloudflare Pages using wrangler.
 
-    Retries up to _MAX_ATTEMPTS times to handle transient Cloudflare API errors.
+    Retries up to _MAX_ATTEMPTS times, with exponential backoff and jitter,
+    to handle transient Cloudflare API errors. Auth and configuration errors
+    (see _UNRECOVERABLE) fail immediately.
 
     Args:
         site_dir:     Path to the built site directory
@@ -54,35 +144,32 @@ def deploy_site(site_dir: str, project_name: str, account_id: str = None) -> boo
 
     for attempt in range(1, _MAX_ATTEMPTS + 1):
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=120,
-                env=env,
-            )
-            if result.returncode == 0:
+            returncode, output = _run_streaming(cmd, env, _DEPLOY_TIMEOUT)
+            if returncode == 0:
                 logger.info("Deployment succeeded")
-                if result.stdout:
-                    logger.info(result.stdout.strip())
                 return True
             else:
                 logger.warning(
-                    f"Deployment attempt {attempt}/{_MAX_ATTEMPTS} failed (exit code {result.returncode})"
+                    f"Deployment attempt {attempt}/{_MAX_ATTEMPTS} failed (exit code {returncode})"
                 )
-                if result.stderr:
-                    logger.warning(result.stderr.strip())
+                lowered = output.lower()
+                fatal = next((m for m in _UNRECOVERABLE if m.lower() in lowered), None)
+                if fatal:
+                    logger.error(f"Unrecoverable deployment error ({fatal}); not retrying")
+                    return False
                 if attempt < _MAX_ATTEMPTS:
-                    logger.info(f"Retrying in {_RETRY_DELAY}s …")
-                    time.sleep(_RETRY_DELAY)
+                    delay = _retry_delay(attempt)
+                    logger.info(f"Retrying in {delay:.1f}s …")
+                    time.sleep(delay)
         except FileNotFoundError:
             logger.error("wrangler not found. Install it with: npm install -g wrangler")
             return False
         except subprocess.TimeoutExpired:
-            logger.warning(f"Deployment attempt {attempt}/{_MAX_ATTEMPTS} timed out after 120s")
+            logger.warning(f"Deployment attempt {attempt}/{_MAX_ATTEMPTS} timed out after {_DEPLOY_TIMEOUT}s")
             if attempt < _MAX_ATTEMPTS:
-                logger.info(f"Retrying in {_RETRY_DELAY}s …")
-                time.sleep(_RETRY_DELAY)
+                delay = _retry_delay(attempt)
+                logger.info(f"Retrying in {delay:.1f}s …")
+                time.sleep(delay)
         except Exception as e:
             logger.error(f"Deployment failed: {e}")
             return False
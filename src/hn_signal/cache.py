@@ -0,0 +1,96 @@
+"""SQLite-backed TTL cache for HN comment trees.
+
+Entries are keyed on (story_id, comment-count bucket). Buckets are
+logarithmic, so a thread whose comment count has doubled since it was cached
+(the pipeline's "update" threshold) always misses and is refetched.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 26 * 3600   # long enough to cover yesterday's run
+PURGE_AFTER_DAYS = 7
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+def _bucket(num_comments: int | None) -> int:
+    # floor(log2(n)) + 1 for n >= 1: doubling the count always moves up a bucket
+    return max(num_comments or 0, 0).bit_length()
+
+
+def init(db_path: str | Path) -> None:
+    """Open the cache database and purge rows older than PURGE_AFTER_DAYS."""
+    global _conn
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+        _conn = sqlite3.connect(db_path, check_same_thread=False)
+        _conn.execute("""
+            CREATE TABLE IF NOT EXISTS comments (
+                story_id TEXT,
+                bucket INTEGER,
+                comments TEXT,
+                fetched_at REAL,
+                ttl REAL,
+                PRIMARY KEY (story_id, bucket)
+            )
+        """)
+        cutoff = time.time() - PURGE_AFTER_DAYS * 86400
+        purged = _conn.execute("DELETE FROM comments WHERE fetched_at < ?", (cutoff,)).rowcount
+        _conn.commit()
+    if purged:
+        logger.info("Purged %d stale comment cache entries", purged)
+
+
+def close() -> None:
+    """Close the cache database, if open."""
+    global _conn
+    with _lock:
+        if _conn is not None:
+            _conn.close()
+            _conn = None
+
+
+def get(story_id, num_comments: int | None) -> list[dict] | None:
+    """Return cached comments for a story, or None on miss/expiry."""
+    if _conn is None:
+        return None
+    with _lock:
+        row = _conn.execute(
+            "SELECT comments, fetched_at, ttl FROM comments WHERE story_id = ? AND bucket = ?",
+            (str(story_id), _bucket(num_comments)),
+        ).fetchone()
+    if not row:
+        return None
+    comments, fetched_at, ttl = row
+    if time.time() - fetched_at > ttl:
+        return None
+    return json.loads(comments)
+
+
+def put(
+    story_id,
+    num_comments: int | None,
+    comments: list[dict],
+    ttl: float = DEFAULT_TTL_SECONDS,
+) -> None:
+    """Store the extracted comments for a story."""
+    if _conn is None:
+        return
+    with _lock:
+        _conn.execute(
+            "INSERT OR REPLACE INTO comments (story_id, bucket, comments, fetched_at, ttl) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (str(story_id), _bucket(num_comments), json.dumps(comments, ensure_ascii=False), time.time(), ttl),
+        )
+        _conn.commit()
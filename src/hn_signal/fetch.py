@@ -1,9 +1,19 @@
 """HN Algolia API data fetching."""
 
+import heapq
+import json
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.hn_signal import cache
 
 logger = logging.getLogger(__name__)
 
@@ -12,17 +22,93 @@ HN_ALGOLIA_FRONT_PAGE = "https://hn.algolia.com/api/v1/search_by_date?tags=front
 HN_ALGOLIA_ITEM = "https://hn.algolia.com/api/v1/items/{id}"
 TOP_STORIES_COUNT = 15
 COMMENTS_PER_STORY = 15
+COMMENT_MAX_DEPTH = 2          # reply levels walked below top-level comments
+COMMENT_DEPTH_PENALTY = 2      # score penalty (in replies) per reply level
 FRESHNESS_HOURS = 18
 STALE_HOURS = 20
 STALE_COMMENT_RATIO = 0.5
+COMMENT_FETCH_WORKERS = 8
+FRONT_PAGE_FRESH_SECONDS = 5 * 60     # serve cached front page as-is
+FRONT_PAGE_STALE_SECONDS = 35 * 60    # serve cached front page, refresh in background
 
+# Every call goes to hn.algolia.com, so share one keep-alive session holding a
+# single host pool with at most one connection per comment-fetch worker; the
+# pool blocks rather than opening throwaway extra connections under load.
+# Transient 429/5xx and connection errors are retried with exponential backoff.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    respect_retry_after_header=True,
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=COMMENT_FETCH_WORKERS,
+    pool_block=True,
+    max_retries=_RETRY,
+))
 
-def fetch_front_page() -> list[dict]:
-    """Fetch current front page stories from HN Algolia API."""
-    logger.info("Fetching front page stories...")
-    resp = requests.get(HN_ALGOLIA_FRONT_PAGE, timeout=30)
+
+def _request_front_page() -> list[dict]:
+    resp = _SESSION.get(HN_ALGOLIA_FRONT_PAGE, timeout=30)
     resp.raise_for_status()
-    hits = resp.json().get("hits", [])
+    return resp.json().get("hits", [])
+
+
+def _read_front_page_cache(path: Path) -> tuple[float, list[dict]] | None:
+    """Return (age_seconds, hits) for the cached front page, or None."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return time.time() - data["fetched_at"], data["hits"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_front_page_cache(path: Path, hits: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"fetched_at": time.time(), "hits": hits}), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _refresh_front_page_cache(path: Path) -> None:
+    try:
+        _write_front_page_cache(path, _request_front_page())
+        logger.debug("Refreshed front page cache in background")
+    except Exception as e:
+        logger.warning("Background front page refresh failed: %s", e)
+
+
+def fetch_front_page(cache_path: str | Path | None = None) -> list[dict]:
+    """Fetch current front page stories from HN Algolia API.
+
+    With a cache_path, a recent cached response is served without blocking
+    (stale-while-revalidate): fresh hits are returned as-is, stale hits are
+    returned while a background thread refreshes the cache, and only a
+    missing or rotten cache blocks on the network.
+    """
+    logger.info("Fetching front page stories...")
+    if cache_path:
+        cache_path = Path(cache_path)
+        cached = _read_front_page_cache(cache_path)
+        if cached is not None:
+            age, hits = cached
+            if age < FRONT_PAGE_FRESH_SECONDS:
+                logger.info("Using cached front page (%d stories, %.0fs old)", len(hits), age)
+                return hits
+            if age < FRONT_PAGE_STALE_SECONDS:
+                logger.info("Using stale front page (%d stories, %.0fs old); refreshing", len(hits), age)
+                threading.Thread(target=_refresh_front_page_cache, args=(cache_path,), daemon=True).start()
+                return hits
+
+    hits = _request_front_page()
+    if cache_path:
+        try:
+            _write_front_page_cache(cache_path, hits)
+        except OSError as e:
+            logger.warning("Could not write front page cache: %s", e)
     logger.info("Fetched %d front page stories", len(hits))
     return hits
 
@@ -34,17 +120,20 @@ def score_story(story: dict) -> float:
     return points + comments * 1.5
 
 
-def is_fresh(story: dict, now: datetime) -> bool:
-    """Check if a story passes the freshness filter."""
-    created = story.get("created_at")
-    if not created:
-        return True
-    try:
-        created_dt = datetime.fromisoformat(created.replace("Z", "+00:00"))
-    except (ValueError, TypeError):
-        return True
+def is_fresh(story: dict, now_ts: float) -> bool:
+    """Check if a story passes the freshness filter (now_ts is a Unix timestamp)."""
+    created_ts = story.get("created_at_i")
+    if created_ts is None:
+        # Algolia normally supplies the integer timestamp; fall back to the ISO string
+        created = story.get("created_at")
+        if not created:
+            return True
+        try:
+            created_ts = datetime.fromisoformat(created.replace("Z", "+00:00")).timestamp()
+        except (ValueError, TypeError):
+            return True
 
-    age_hours = (now - created_dt).total_seconds() / 3600
+    age_hours = (now_ts - created_ts) / 3600
     if age_hours < FRESHNESS_HOURS:
         return True
     if age_hours < STALE_HOURS:
@@ -56,58 +145,90 @@ def is_fresh(story: dict, now: datetime) -> bool:
     return (comments / points) > STALE_COMMENT_RATIO
 
 
+def _comment_score(comment: dict, depth: int) -> float:
+    # Algolia item payloads carry `points: null` for comments, so direct reply
+    # count stands in as the engagement signal
+    return len(comment.get("children") or []) - COMMENT_DEPTH_PENALTY * depth
+
+
 def extract_comments(children: list[dict], limit: int) -> list[dict]:
-    """Extract top comments from a nested comment tree (breadth-first)."""
-    comments = []
-    queue = list(children or [])
-    while queue and len(comments) < limit:
-        child = queue.pop(0)
-        if child.get("text") and child.get("author"):
-            comments.append({
-                "author": child["author"],
-                "text": child["text"][:500],
-            })
-        queue.extend(child.get("children") or [])
-    return comments
-
-
-def fetch_story_comments(story_id: int) -> list[dict]:
-    """Fetch the comment tree for a specific story."""
+    """Extract the top comments from a nested comment tree by reply count.
+
+    Walks at most COMMENT_MAX_DEPTH levels below the story, descending only
+    into the `limit` most-replied comments at each level, and returns the
+    `limit` highest-scoring comments overall (ties keep breadth-first order).
+    """
+    candidates = []  # (score, -visit_order, comment)
+    level = [c for c in (children or []) if c]
+    order = 0
+    for depth in range(COMMENT_MAX_DEPTH + 1):
+        if not level:
+            break
+        scored = []
+        for child in level:
+            score = _comment_score(child, depth)
+            scored.append((score, -order, child))
+            if child.get("text") and child.get("author"):
+                candidates.append((score, -order, {
+                    "author": child["author"],
+                    "text": child["text"][:500],
+                }))
+            order += 1
+        roots = heapq.nlargest(limit, scored, key=lambda t: t[:2])
+        level = [c for _, _, root in roots for c in (root.get("children") or []) if c]
+    top = heapq.nlargest(limit, candidates, key=lambda t: t[:2])
+    return [comment for _, _, comment in top]
+
+
+def fetch_story_comments(story_id: int, num_comments: int | None = None) -> list[dict]:
+    """Fetch the comment tree for a specific story, using the on-disk cache when warm."""
+    cached = cache.get(story_id, num_comments)
+    if cached is not None:
+        logger.debug("Comment cache hit for story %s", story_id)
+        return cached
+
     url = HN_ALGOLIA_ITEM.format(id=story_id)
     try:
-        resp = requests.get(url, timeout=30)
+        resp = _SESSION.get(url, timeout=30)
         resp.raise_for_status()
         data = resp.json()
-        return extract_comments(data.get("children", []), COMMENTS_PER_STORY)
+        comments = extract_comments(data.get("children", []), COMMENTS_PER_STORY)
+        cache.put(story_id, num_comments, comments)
+        return comments
     except requests.RequestException as e:
-        logger.warning("Failed to fetch comments for story %s: %s", story_id, e)
+        # Retries are handled by the session adapter; this is the final fallback.
+        logger.warning("Failed to fetch comments for story %s after retries: %s", story_id, e)
         return []
 
 
-def fetch_stories(seen_ids: dict | None = None) -> list[dict]:
+def fetch_stories(
+    seen_ids: dict | None = None,
+    frontpage_cache_path: str | Path | None = None,
+) -> list[dict]:
     """Fetch, filter, rank, and enrich top HN stories.
 
     Args:
         seen_ids: dict mapping story ID strings to metadata dicts
                   with keys 'first_seen' and 'num_comments'.
+        frontpage_cache_path: optional path for the stale-while-revalidate
+                  front page cache.
 
     Returns:
         List of story dicts ready for synthesis.
     """
     seen_ids = seen_ids or {}
-    now = datetime.now(timezone.utc)
+    now_ts = datetime.now(timezone.utc).timestamp()
 
-    hits = fetch_front_page()
+    hits = fetch_front_page(frontpage_cache_path)
 
-    # Apply freshness filter
-    fresh = [s for s in hits if is_fresh(s, now)]
+    # Apply freshness filter, tagging each survivor with its string ID
+    fresh = [(str(s.get("objectID", "")), s) for s in hits if is_fresh(s, now_ts)]
     logger.info("%d stories pass freshness filter", len(fresh))
 
     # Separate new vs update stories
     new_stories = []
     update_stories = []
-    for s in fresh:
-        sid = str(s.get("objectID", ""))
+    for sid, s in fresh:
         if sid in seen_ids:
             prev = seen_ids[sid]
             prev_comments = prev.get("num_comments", 0)
@@ -126,16 +247,17 @@ def fetch_stories(seen_ids: dict | None = None) -> list[dict]:
     selected.extend(update_stories)
     logger.info("Selected %d stories (%d updates)", len(selected), len(update_stories))
 
-    # Fetch comments for selected stories
-    enriched = []
-    for s in selected:
-        story_id = s.get("objectID")
-        if not story_id:
-            continue
+    # Fetch comments for selected stories (network-bound, so fan out)
+    selected = [s for s in selected if s.get("objectID")]
+    story_ids = [s["objectID"] for s in selected]
+    comment_counts = [s.get("num_comments") for s in selected]
+    with ThreadPoolExecutor(max_workers=COMMENT_FETCH_WORKERS) as executor:
+        comments_list = list(executor.map(fetch_story_comments, story_ids, comment_counts))
 
-        comments = fetch_story_comments(story_id)
+    enriched = []
+    for s, comments in zip(selected, comments_list):
         enriched.append({
-            "id": story_id,
+            "id": s["objectID"],
             "title": s.get("title", ""),
             "url": s.get("url", ""),
             "points": s.get("points", 0),
@@ -7,9 +7,11 @@ and synthesizes a morning digest via Claude.
 
 import json
 import logging
+import sqlite3
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from src.hn_signal import cache
 from src.hn_signal.fetch import fetch_stories
 from src.hn_signal.synthesize import synthesize
 
@@ -18,33 +20,89 @@ logger = logging.getLogger(__name__)
 SEEN_IDS_MAX_AGE_DAYS = 7
 
 
+def _db_conn(path: Path) -> sqlite3.Connection:
+    """Open the seen-IDs database (WAL mode), creating the table if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS seen (
+            id TEXT PRIMARY KEY,
+            first_seen TEXT,
+            num_comments INTEGER
+        )
+    """)
+    conn.commit()
+    return conn
+
+
+def _migrate_legacy_json(conn: sqlite3.Connection, path: Path) -> None:
+    """One-shot import of the old seen-IDs JSON file into an empty table."""
+    legacy = path.with_suffix(".json")
+    if legacy == path or not legacy.exists():
+        return
+    if conn.execute("SELECT 1 FROM seen LIMIT 1").fetchone():
+        return
+    try:
+        data = json.loads(legacy.read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.warning("Failed to read legacy seen IDs from %s: %s", legacy, e)
+        return
+    # Entries without a parseable first_seen would sort before any cutoff and be
+    # pruned on the next save; date them to the migration instead
+    migrated_at = datetime.now(timezone.utc).isoformat()
+    rows = []
+    for sid, meta in data.items():
+        first_seen = meta.get("first_seen", "")
+        try:
+            datetime.fromisoformat(first_seen)
+        except (ValueError, TypeError):
+            first_seen = migrated_at
+        rows.append((sid, first_seen, meta.get("num_comments", 0)))
+    with conn:
+        conn.executemany(
+            "INSERT OR IGNORE INTO seen (id, first_seen, num_comments) VALUES (?, ?, ?)",
+            rows,
+        )
+    logger.info("Migrated %d seen IDs from %s", len(data), legacy)
+
+
 def _load_seen_ids(path: Path) -> dict:
     """Load seen story IDs from disk."""
-    if not path.exists():
-        return {}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception as e:
+        conn = _db_conn(path)
+    except sqlite3.Error as e:
         logger.warning("Failed to load seen IDs from %s: %s", path, e)
         return {}
+    try:
+        _migrate_legacy_json(conn, path)
+        return {
+            sid: {"first_seen": first_seen, "num_comments": num_comments}
+            for sid, first_seen, num_comments in conn.execute(
+                "SELECT id, first_seen, num_comments FROM seen"
+            )
+        }
+    finally:
+        conn.close()
 
 
 def _save_seen_ids(seen: dict, path: Path) -> None:
-    """Save seen story IDs to disk, pruning old entries."""
-    cutoff = datetime.now(timezone.utc) - timedelta(days=SEEN_IDS_MAX_AGE_DAYS)
-    pruned = {}
-    for sid, meta in seen.items():
-        first_seen = meta.get("first_seen", "")
-        try:
-            dt = datetime.fromisoformat(first_seen)
-            if dt > cutoff:
-                pruned[sid] = meta
-        except (ValueError, TypeError):
-            pruned[sid] = meta
-
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(pruned, indent=2), encoding="utf-8")
-    logger.info("Saved %d seen IDs (pruned %d)", len(pruned), len(seen) - len(pruned))
+    """Upsert the given seen story IDs and prune entries past the max age."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=SEEN_IDS_MAX_AGE_DAYS)).isoformat()
+    conn = _db_conn(path)
+    try:
+        with conn:
+            conn.executemany(
+                """
+                INSERT INTO seen (id, first_seen, num_comments) VALUES (?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET num_comments = excluded.num_comments
+                """,
+                [(sid, meta["first_seen"], meta.get("num_comments", 0)) for sid, meta in seen.items()],
+            )
+            pruned = conn.execute("DELETE FROM seen WHERE first_seen < ?", (cutoff,)).rowcount
+    finally:
+        conn.close()
+    logger.info("Saved %d seen IDs (pruned %d)", len(seen), pruned)
 
 
 def run(
@@ -53,15 +111,19 @@ def run(
     model: str,
     max_tokens: int,
     temperature: float,
+    comments_cache_path: str | Path | None = None,
+    frontpage_cache_path: str | Path | None = None,
 ) -> str:
     """Run the HN Signal pipeline.
 
     Args:
         api_key:       Anthropic API key.
-        seen_ids_path: Path to the seen-IDs JSON file.
+        seen_ids_path: Path to the seen-IDs SQLite database.
         model:         Claude model ID.
         max_tokens:    Max synthesis tokens.
         temperature:   Sampling temperature.
+        comments_cache_path: Optional path to the SQLite comment-tree cache.
+        frontpage_cache_path: Optional path to the cached front page JSON.
 
     Returns:
         Markdown digest string, or "" if nothing new.
@@ -69,8 +131,14 @@ def run(
     seen_path = Path(seen_ids_path)
     seen_ids = _load_seen_ids(seen_path)
 
+    if comments_cache_path:
+        cache.init(comments_cache_path)
+
     logger.info("HN Signal: fetching stories (seen=%d)...", len(seen_ids))
-    stories = fetch_stories(seen_ids)
+    try:
+        stories = fetch_stories(seen_ids, frontpage_cache_path)
+    finally:
+        cache.close()
 
     if not stories:
         logger.info("HN Signal: no new stories — quiet day")
@@ -85,14 +153,15 @@ def run(
         api_key=api_key,
     )
 
-    # Update seen IDs
+    # Update seen IDs (only today's stories are written)
     now_iso = datetime.now(timezone.utc).isoformat()
+    todays = {}
     for s in stories:
         sid = str(s["id"])
-        seen_ids[sid] = {
+        todays[sid] = {
             "first_seen": seen_ids.get(sid, {}).get("first_seen", now_iso),
             "num_comments": s.get("num_comments", 0),
         }
-    _save_seen_ids(seen_ids, seen_path)
+    _save_seen_ids(todays, seen_path)
 
     return digest_md
@@ -1,12 +1,16 @@
 """Claude API synthesis for HN Signal digest."""
 
-import json
 import logging
 
 import anthropic
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Only these story fields are referenced by the prompt; the rest cost tokens
+PROMPT_STORY_FIELDS = ("id", "title", "points", "num_comments", "update", "comments")
+PROMPT_COMMENT_CHARS = 300
+
 SYSTEM_PROMPT = """\
 You are a friendly and knowledgeable tech guide who writes a daily morning digest of Hacker News. \
 Your audience is people who are curious about tech and software but are still learning — they may not \
@@ -94,22 +98,39 @@ def synthesize(
     Returns:
         Markdown string of the generated digest.
     """
-    stories_json = json.dumps(stories, indent=2, ensure_ascii=False)
+    prompt_stories = [
+        {
+            **{k: s[k] for k in PROMPT_STORY_FIELDS if k in s},
+            "comments": [
+                {"author": c["author"], "text": c["text"][:PROMPT_COMMENT_CHARS]}
+                for c in s.get("comments", [])
+            ],
+        }
+        for s in stories
+    ]
+    # orjson emits compact UTF-8 by default
+    stories_json = orjson.dumps(prompt_stories).decode("utf-8")
     user_message = USER_PROMPT_TEMPLATE.format(stories_json=stories_json)
 
     logger.info("Sending %d stories to Claude (%s)...", len(stories), model)
     logger.debug("Input size: ~%d chars", len(user_message))
 
     client = anthropic.Anthropic(api_key=api_key)
-    message = client.messages.create(
+    parts: list[str] = []
+    with client.messages.stream(
         model=model,
         max_tokens=min(max_tokens, 4096),
         temperature=temperature,
+        # No cache_control: the system prompt is below the 1024-token caching
+        # minimum, and the once-a-day run never re-reads a cached stories block.
         system=SYSTEM_PROMPT,
         messages=[{"role": "user", "content": user_message}],
-    )
+    ) as stream:
+        for chunk in stream.text_stream:
+            parts.append(chunk)
+        message = stream.get_final_message()
 
-    digest = message.content[0].text
+    digest = "".join(parts)
     logger.info(
         "HN Signal digest: %d chars, usage: %d in / %d out",
         len(digest),
@@ -11,12 +11,16 @@ Usage:
     python -m src.main --dry-run      # Build site locally, skip deploy
     python -m src.main --no-deploy    # Same as --dry-run
     python -m src.main --verbose      # Enable debug logging
+    python -m src.main --full-rebuild # Rewrite every archive page, not just changed days
+    python -m src.main --backfill 7   # Re-synthesize the last 7 days of Pure Signal (Batch API)
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from zoneinfo import ZoneInfo
@@ -30,10 +34,13 @@ from src.pure_signal import pipeline as ps_pipeline
 from src.maranello import pipeline as mar_pipeline
 from src.hn_signal import pipeline as hn_pipeline
 from src.site_builder import SiteBuilder
-from src.deployer import deploy_site
+from src.deployer import deploy_site, warm_up_wrangler
 
 logger = logging.getLogger(__name__)
 
+# Prefer libyaml's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def setup_logging(log_file: Path = None, verbose: bool = False) -> None:
     level = logging.DEBUG if verbose else logging.INFO
@@ -48,14 +55,19 @@ def setup_logging(log_file: Path = None, verbose: bool = False) -> None:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def load_config() -> dict:
     path = PROJECT_ROOT / "config" / "config.yaml"
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
+@functools.lru_cache(maxsize=1)
 def load_credentials() -> dict:
-    """Load credentials from env vars (priority) or credentials.yaml."""
+    """Load credentials from env vars (priority) or credentials.yaml.
+
+    Cached for the life of the process; treat the returned dict as read-only.
+    """
     creds = {
         "anthropic": {"api_key": os.environ.get("ANTHROPIC_API_KEY", "")},
         "cloudflare": {"api_token": os.environ.get("CLOUDFLARE_API_TOKEN", "")},
@@ -63,7 +75,7 @@ def load_credentials() -> dict:
     path = PROJECT_ROOT / "config" / "credentials.yaml"
     if path.exists():
         with open(path) as f:
-            file_creds = yaml.safe_load(f) or {}
+            file_creds = yaml.load(f, Loader=_YamlLoader) or {}
         for section, values in file_creds.items():
             if section not in creds:
                 creds[section] = {}
@@ -73,11 +85,79 @@ def load_credentials() -> dict:
     return creds
 
 
+def pure_signal_kwargs(config: dict) -> dict:
+    """Pure Signal settings shared by the daily run and backfills."""
+    synthesis_cfg = config.get("synthesis", {})
+    return dict(
+        people_config=config.get("people", {}),
+        synthesis_model=synthesis_cfg.get("model", "claude-sonnet-4-6"),
+        max_tokens=synthesis_cfg.get("max_tokens", 8000),
+        temperature=synthesis_cfg.get("temperature", 0.7),
+        rss_delay=config.get("rate_limits", {}).get("rss_delay_seconds", 1.0),
+        haiku_model=synthesis_cfg.get("haiku_model", "claude-haiku-4-5"),
+        router_threshold_chars=synthesis_cfg.get("router_threshold_chars", 8000),
+        tokens_per_item=synthesis_cfg.get("tokens_per_item", 200),
+        min_tokens=synthesis_cfg.get("min_tokens", 1500),
+    )
+
+
+def backfill(days: int, config: dict, api_key: str, builder: SiteBuilder) -> set[str]:
+    """Re-synthesize past Pure Signal digests into the archive; return the dates saved."""
+    digests = ps_pipeline.backfill(api_key=api_key, days=days, **pure_signal_kwargs(config))
+    for date_str, digest in sorted(digests.items()):
+        # Keep the other sections already archived for that day
+        entry = builder.load_archive_entry(date_str) or {}
+        builder.save_combined_archive(
+            date_str,
+            digest,
+            entry.get("maranello") or {"briefing": "", "source_links": []},
+            hn_signal=entry.get("hn_signal", ""),
+        )
+    return set(digests)
+
+
+def publish(builder: SiteBuilder, changed_dates: set[str], args, config: dict, credentials: dict) -> int:
+    """Build the site from the archive and, unless skipped, deploy it."""
+    skip_deploy = args.dry_run or args.no_deploy
+    if not skip_deploy:
+        # Hide wrangler's cold start behind the site build
+        warm_up_wrangler()
+
+    # --full-rebuild ignores changed_dates and rebuilds every day
+    builder.build(full_rebuild=args.full_rebuild, changed_dates=changed_dates)
+
+    if skip_deploy:
+        logger.info("Skipping deploy (site built in site/)")
+        return 0
+
+    cf_cfg      = config.get("cloudflare", {})
+    project     = cf_cfg.get("project_name", "")
+    account_id  = cf_cfg.get("account_id", "")
+
+    # Inject Cloudflare token into env if supplied via credentials file
+    cf_token = credentials.get("cloudflare", {}).get("api_token", "")
+    if cf_token and not os.environ.get("CLOUDFLARE_API_TOKEN"):
+        os.environ["CLOUDFLARE_API_TOKEN"] = cf_token
+
+    success = deploy_site(str(builder.site_dir), project_name=project, account_id=account_id)
+    if success:
+        logger.info("=== Signal Hub — published successfully ===")
+    else:
+        logger.error("Site built but deployment failed")
+
+    return 0 if success else 1
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Signal Hub — combined daily digest")
     parser.add_argument("--dry-run", action="store_true", help="Build site but skip deploy")
     parser.add_argument("--no-deploy", action="store_true", help="Same as --dry-run")
     parser.add_argument("--verbose", "-v", action="store_true", help="Debug logging")
+    parser.add_argument("--full-rebuild", action="store_true", help="Rewrite all archive pages")
+    parser.add_argument(
+        "--backfill", type=int, metavar="DAYS",
+        help="Re-synthesize Pure Signal for the past DAYS days via the Batch API instead of the daily run",
+    )
     args = parser.parse_args()
 
     config = load_config()
@@ -93,54 +173,72 @@ def main() -> int:
         return 1
 
     paths_cfg = config.get("paths", {})
-    ps_dedup_path = PROJECT_ROOT / paths_cfg.get("pure_signal_dedup", "data/pure_signal_processed.json")
+    ps_dedup_path = PROJECT_ROOT / paths_cfg.get("pure_signal_dedup", "data/pure_signal_processed.db")
     mar_db_path   = PROJECT_ROOT / paths_cfg.get("maranello_seen_db",  "data/maranello_seen.db")
-    hn_seen_path  = PROJECT_ROOT / paths_cfg.get("hn_signal_seen",     "data/hn_signal_seen.json")
+    hn_seen_path  = PROJECT_ROOT / paths_cfg.get("hn_signal_seen",     "data/hn_signal_seen.db")
+    hn_cache_path = PROJECT_ROOT / paths_cfg.get("hn_comments_cache",  "data/hn_comments_cache.db")
+    hn_fp_path    = PROJECT_ROOT / paths_cfg.get("hn_frontpage_cache", "data/hn_frontpage_cache.json")
+    ps_synth_path = PROJECT_ROOT / paths_cfg.get("pure_signal_synth_cache", "data/pure_signal_synth_cache")
     archive_dir   = PROJECT_ROOT / paths_cfg.get("archive_dir",        "data/archive")
     site_dir      = PROJECT_ROOT / "site"
 
+    builder = SiteBuilder(site_dir=str(site_dir), archive_dir=str(archive_dir))
+    if args.backfill:
+        changed_dates = backfill(args.backfill, config, api_key, builder)
+        if not changed_dates:
+            logger.info("Backfill produced no digests — nothing to publish.")
+            return 0
+        return publish(builder, changed_dates, args, config, credentials)
+
     synthesis_cfg = config.get("synthesis", {})
     model         = synthesis_cfg.get("model", "claude-sonnet-4-6")
     max_tokens    = synthesis_cfg.get("max_tokens", 8000)
     temperature   = synthesis_cfg.get("temperature", 0.7)
     lookback      = config.get("lookback_hours", 24)
 
-    # ── Run Pure Signal pipeline ────────────────────────────────────────
-    try:
-        pure_signal_digest = ps_pipeline.run(
-            people_config=config.get("people", {}),
+    # ── Run all three pipelines concurrently ────────────────────────────
+    # Each is independent and I/O-bound (feeds, HN Algolia, Claude API), so
+    # wall-clock is the slowest pipeline rather than the sum.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        ps_future = executor.submit(
+            ps_pipeline.run,
             api_key=api_key,
             dedup_path=ps_dedup_path,
-            synthesis_model=model,
+            lookback_hours=lookback,
+            synth_cache_dir=ps_synth_path,
+            **pure_signal_kwargs(config),
+        )
+        mar_future = executor.submit(
+            mar_pipeline.run,
+            api_key=api_key,
+            db_path=mar_db_path,
+            model=model,
+        )
+        hn_future = executor.submit(
+            hn_pipeline.run,
+            api_key=api_key,
+            seen_ids_path=hn_seen_path,
+            comments_cache_path=hn_cache_path,
+            frontpage_cache_path=hn_fp_path,
+            model=model,
             max_tokens=max_tokens,
             temperature=temperature,
-            lookback_hours=lookback,
-            rss_delay=config.get("rate_limits", {}).get("rss_delay_seconds", 1.0),
         )
+
+    try:
+        pure_signal_digest = ps_future.result()
     except Exception:
         logger.exception("Pure Signal pipeline failed")
         pure_signal_digest = ""
 
-    # ── Run Maranello pipeline ──────────────────────────────────────────
     try:
-        maranello_result = mar_pipeline.run(
-            api_key=api_key,
-            db_path=mar_db_path,
-            model=model,
-        )
+        maranello_result = mar_future.result()
     except Exception:
         logger.exception("Maranello pipeline failed")
         maranello_result = {"briefing": "", "source_links": []}
 
-    # ── Run HN Signal pipeline ──────────────────────────────────────────
     try:
-        hn_signal_digest = hn_pipeline.run(
-            api_key=api_key,
-            seen_ids_path=hn_seen_path,
-            model=model,
-            max_tokens=max_tokens,
-            temperature=temperature,
-        )
+        hn_signal_digest = hn_future.result()
     except Exception:
         logger.exception("HN Signal pipeline failed")
         hn_signal_digest = ""
@@ -164,30 +262,9 @@ def main() -> int:
     # ── Build and publish ───────────────────────────────────────────────
     today = datetime.now(ZoneInfo("America/New_York")).strftime("%Y-%m-%d")
 
-    builder = SiteBuilder(site_dir=str(site_dir), archive_dir=str(archive_dir))
     builder.save_combined_archive(today, pure_signal_digest, maranello_result, hn_signal=hn_signal_digest)
-    builder.build()
-
-    if args.dry_run or args.no_deploy:
-        logger.info("Skipping deploy (site built in site/)")
-        return 0
-
-    cf_cfg      = config.get("cloudflare", {})
-    project     = cf_cfg.get("project_name", "")
-    account_id  = cf_cfg.get("account_id", "")
-
-    # Inject Cloudflare token into env if supplied via credentials file
-    cf_token = credentials.get("cloudflare", {}).get("api_token", "")
-    if cf_token and not os.environ.get("CLOUDFLARE_API_TOKEN"):
-        os.environ["CLOUDFLARE_API_TOKEN"] = cf_token
-
-    success = deploy_site(str(site_dir), project_name=project, account_id=account_id)
-    if success:
-        logger.info("=== Signal Hub — published successfully ===")
-    else:
-        logger.error("Site built but deployment failed")
-
-    return 0 if success else 1
+    # Only today's archive entry changed
+    return publish(builder, {today}, args, config, credentials)
 
 
 if __name__ == "__main__":
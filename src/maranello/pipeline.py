@@ -12,22 +12,38 @@ import json
 import logging
 import re
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
 import anthropic
 import feedparser
+import json_repair
+import orjson
 
 log = logging.getLogger(__name__)
 
+# "prefilter": general F1 feeds whose items must mention Ferrari (see _FERRARI_RE)
+# before being sent to Claude; Ferrari-only feeds skip the keyword check.
 FEEDS = [
-    {"name": "Formu1a.uno",        "url": "https://www.formu1a.uno/feed/",                                "lang": "it"},
+    {"name": "Formu1a.uno",        "url": "https://www.formu1a.uno/feed/",                                "lang": "it", "prefilter": True},
     {"name": "Ferrari Media",      "url": "https://media.ferrari.com/feed/",                              "lang": "en"},
-    {"name": "Motorsport.com IT",  "url": "https://it.motorsport.com/rss/f1/news/",                       "lang": "it"},
+    {"name": "Motorsport.com IT",  "url": "https://it.motorsport.com/rss/f1/news/",                       "lang": "it", "prefilter": True},
     {"name": "r/ScuderiaFerrari", "url": "https://www.reddit.com/r/ScuderiaFerrari/new/.rss",             "lang": "en"},
 ]
 
+_FERRARI_RE = re.compile(
+    r"ferrari|leclerc|hamilton|vasseur|scuderia|maranello|cavallino|sf-?2[0-9]|tifosi",
+    re.IGNORECASE,
+)
+
+_SQL_IN_CHUNK       = 900  # stay under SQLite's bound-variable limit
+_BATCH_SIZE         = 30   # items per Claude analysis call
+_RATE_LIMIT_RETRIES = 3    # SDK-level retries (429/5xx, exponential backoff)
+_SUMMARY_CHARS      = 1500 # summary text kept per item (truncated at ingestion)
+
 SYSTEM_PROMPT = """\
 You are the voice of Maranello Signal — a daily podcast-style briefing \
 focused exclusively on Scuderia Ferrari.
@@ -63,9 +79,21 @@ If NONE of the items are Ferrari-related, return:
 No markdown fences. Only valid JSON."""
 
 
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=60000",
+)
+
+
 def _init_db(db_path: Path) -> sqlite3.Connection:
+    """Open the seen-hash DB in autocommit mode; callers batch writes with BEGIN/COMMIT."""
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS seen (
             hash TEXT PRIMARY KEY,
@@ -74,12 +102,63 @@ def _init_db(db_path: Path) -> sqlite3.Connection:
             ts TEXT
         )
     """)
-    conn.commit()
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_ts ON seen(ts)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS feed_meta (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            modified TEXT
+        )
+    """)
     return conn
 
 
+def _load_feed_meta(conn: sqlite3.Connection) -> dict[str, tuple[str | None, str | None]]:
+    """Return {feed url: (etag, modified)} from the last successful poll."""
+    return {url: (etag, modified) for url, etag, modified in conn.execute(
+        "SELECT url, etag, modified FROM feed_meta"
+    )}
+
+
+def _save_feed_meta(conn: sqlite3.Connection, meta: dict[str, tuple[str | None, str | None]]) -> None:
+    if not meta:
+        return
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(
+            "INSERT OR REPLACE INTO feed_meta (url, etag, modified) VALUES (?, ?, ?)",
+            [(url, etag, modified) for url, (etag, modified) in meta.items()],
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _existing_hashes(conn: sqlite3.Connection, hashes: list[str]) -> set[str]:
+    """Return the subset of hashes already in the seen table."""
+    existing: set[str] = set()
+    for i in range(0, len(hashes), _SQL_IN_CHUNK):
+        chunk = hashes[i:i + _SQL_IN_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        existing.update(
+            row[0] for row in conn.execute(f"SELECT hash FROM seen WHERE hash IN ({placeholders})", chunk)
+        )
+    return existing
+
+
 def _hash_item(title: str, link: str) -> str:
-    return hashlib.sha256(f"{title}|{link}".encode()).hexdigest()[:16]
+    # Chained updates avoid building the joined string; the digest is identical
+    # to sha256(f"{title}|{link}"), so existing seen hashes stay valid.
+    h = hashlib.sha256(title.encode())
+    h.update(b"|")
+    h.update(link.encode())
+    return h.hexdigest()[:16]
+
+
+@lru_cache(maxsize=4096)
+def _struct_to_datetime(fields: tuple) -> datetime:
+    return datetime(*fields, tzinfo=timezone.utc)
 
 
 def _parse_entry_time(entry) -> datetime | None:
@@ -87,57 +166,98 @@ def _parse_entry_time(entry) -> datetime | None:
         tp = entry.get(field)
         if tp:
             try:
-                return datetime(*tp[:6], tzinfo=timezone.utc)
+                return _struct_to_datetime(tuple(tp[:6]))
             except Exception:
                 continue
     return None
 
 
-def _poll_feeds(cutoff: datetime) -> list[dict]:
+def _poll_feed(
+    feed_def: dict,
+    cutoff: datetime,
+    validators: tuple[str | None, str | None] | None,
+) -> tuple[list[dict], tuple[str | None, str | None] | None]:
+    """Poll one feed, sending the previous ETag/Last-Modified if known.
+
+    Returns (items, new validators or None if they should not be updated).
+    """
+    name = feed_def["name"]
+    url = feed_def["url"]
+    log.info("Polling %s …", name)
+    etag, modified = validators or (None, None)
     items = []
-    for feed_def in FEEDS:
-        name = feed_def["name"]
-        url = feed_def["url"]
-        log.info("Polling %s …", name)
-        try:
-            parsed = feedparser.parse(url)
-            if parsed.bozo and not parsed.entries:
-                log.warning("Feed error for %s: %s", name, parsed.bozo_exception)
+    dropped = 0
+    try:
+        parsed = feedparser.parse(url, etag=etag, modified=modified)
+        if parsed.get("status") == 304:
+            log.info("%s unchanged since last poll", name)
+            return [], None
+        if parsed.bozo and not parsed.entries:
+            log.warning("Feed error for %s: %s", name, parsed.bozo_exception)
+            return [], None
+        for entry in parsed.entries:
+            title = entry.get("title", "").strip()
+            link = entry.get("link", "")
+            summary = (entry.get("summary") or entry.get("description") or "")[:_SUMMARY_CHARS]
+            if not title:
                 continue
-            for entry in parsed.entries:
-                title = entry.get("title", "").strip()
-                link = entry.get("link", "")
-                summary = entry.get("summary", entry.get("description", ""))
-                if not title:
-                    continue
-                pub_time = _parse_entry_time(entry)
-                if pub_time and pub_time < cutoff:
-                    continue
-                items.append({
-                    "source": name,
-                    "lang": feed_def["lang"],
-                    "title": title,
-                    "link": link,
-                    "summary": summary,
-                    "published": entry.get("published", ""),
-                })
-        except Exception:
-            log.exception("Failed to poll %s", name)
-    return items
+            pub_time = _parse_entry_time(entry)
+            if pub_time and pub_time < cutoff:
+                continue
+            if feed_def.get("prefilter") and not _FERRARI_RE.search(f"{title} {summary}"):
+                dropped += 1
+                continue
+            items.append({
+                "source": name,
+                "lang": feed_def["lang"],
+                "title": title,
+                "link": link,
+                "summary": summary,
+                "published": entry.get("published", ""),
+            })
+    except Exception:
+        log.exception("Failed to poll %s", name)
+        return items, None
+    if dropped:
+        log.info("%s: dropped %d non-Ferrari items before analysis", name, dropped)
+    if parsed.get("etag") or parsed.get("modified"):
+        return items, (parsed.get("etag"), parsed.get("modified"))
+    return items, None
+
+
+def _poll_feeds(
+    cutoff: datetime,
+    feed_meta: dict[str, tuple[str | None, str | None]],
+) -> tuple[list[dict], dict[str, tuple[str | None, str | None]]]:
+    """Poll all feeds; returns (items, updated validators keyed by feed url)."""
+    # Feeds live on different hosts and polling is network-bound, so fetch
+    # them concurrently; map() keeps the FEEDS order in the result.
+    with ThreadPoolExecutor(max_workers=min(8, len(FEEDS))) as executor:
+        results = list(executor.map(
+            lambda feed_def: _poll_feed(feed_def, cutoff, feed_meta.get(feed_def["url"])),
+            FEEDS,
+        ))
+    items = [item for feed_items, _ in results for item in feed_items]
+    updated = {
+        feed_def["url"]: validators
+        for feed_def, (_, validators) in zip(FEEDS, results)
+        if validators
+    }
+    return items, updated
 
 
 def _analyse_batch(items: list[dict], api_key: str, model: str) -> dict:
-    client = anthropic.Anthropic(api_key=api_key)
+    client = anthropic.Anthropic(api_key=api_key, max_retries=_RATE_LIMIT_RETRIES)
     payload = [
         {"source": it["source"], "lang": it["lang"], "title": it["title"],
-         "link": it["link"], "text": it["summary"][:1500]}
+         "link": it["link"], "text": it["summary"]}
         for it in items
     ]
     try:
         message = client.messages.create(
             model=model,
             max_tokens=4096,
-            messages=[{"role": "user", "content": f"Analyse these items:\n\n{json.dumps(payload, ensure_ascii=False)}"}],
+            messages=[{"role": "user", "content": f"Analyse these items:\n\n{orjson.dumps(payload).decode()}"}],
             system=SYSTEM_PROMPT,
         )
         raw = message.content[0].text.strip()
@@ -147,16 +267,16 @@ def _analyse_batch(items: list[dict], api_key: str, model: str) -> dict:
             raw = raw.rsplit("```", 1)[0]
         raw = raw.strip()
         try:
-            return json.loads(raw)
+            # strict=False accepts the raw newlines/control chars the model
+            # most often leaves inside "briefing" — a linear C-level parse
+            return json.loads(raw, strict=False)
         except json.JSONDecodeError:
             log.warning("Direct JSON parse failed — attempting repair")
-            raw_fixed = re.sub(
-                r'("briefing":\s*")(.*?)("(?:\s*,|\s*\}))',
-                lambda m: m.group(1) + m.group(2).replace("\n", "\\n").replace("\r", "") + m.group(3),
-                raw,
-                flags=re.DOTALL,
-            )
-            return json.loads(raw_fixed)
+            # Handles unescaped control chars, unterminated strings, trailing commas, …
+            repaired = json_repair.loads(raw)
+            if not isinstance(repaired, dict):
+                raise ValueError(f"Repaired model output is not a JSON object: {type(repaired).__name__}")
+            return repaired
     except Exception:
         log.exception("Maranello analysis failed")
         return {"briefing": "", "source_links": []}
@@ -183,18 +303,29 @@ def run(api_key: str, db_path: Path, model: str = "claude-sonnet-4-6") -> dict:
 
     conn = _init_db(db_path)
     try:
-        raw = _poll_feeds(cutoff)
-        unseen = []
-        for item in raw:
-            h = _hash_item(item["title"], item["link"])
-            row = conn.execute("SELECT 1 FROM seen WHERE hash = ?", (h,)).fetchone()
-            if not row:
-                unseen.append(item)
-                conn.execute(
-                    "INSERT OR IGNORE INTO seen (hash, title, source, ts) VALUES (?, ?, ?, ?)",
-                    (h, item["title"], item["source"], datetime.now(timezone.utc).isoformat()),
-                )
-        conn.commit()
+        raw, feed_meta = _poll_feeds(cutoff, _load_feed_meta(conn))
+        _save_feed_meta(conn, feed_meta)
+        hashes = [_hash_item(item["title"], item["link"]) for item in raw]
+        existing = _existing_hashes(conn, hashes)
+
+        unseen, rows = [], []
+        now_iso = datetime.now(timezone.utc).isoformat()
+        for item, h in zip(raw, hashes):
+            if h in existing:
+                continue
+            existing.add(h)  # also drops duplicates within this poll
+            unseen.append(item)
+            rows.append((h, item["title"], item["source"], now_iso))
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO seen (hash, title, source, ts) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
         if not unseen:
             log.info("No new Ferrari items.")
@@ -202,12 +333,16 @@ def run(api_key: str, db_path: Path, model: str = "claude-sonnet-4-6") -> dict:
 
         log.info("Processing %d new Maranello items …", len(unseen))
 
-        if len(unseen) <= 30:
+        if len(unseen) <= _BATCH_SIZE:
             result = _analyse_batch(unseen, api_key, model)
         else:
+            # Chunks are independent Claude calls; run them concurrently and
+            # keep narrative order via map()
+            chunks = [unseen[i:i + _BATCH_SIZE] for i in range(0, len(unseen), _BATCH_SIZE)]
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                chunk_results = list(executor.map(lambda c: _analyse_batch(c, api_key, model), chunks))
             paragraphs, all_links = [], []
-            for i in range(0, len(unseen), 30):
-                chunk_result = _analyse_batch(unseen[i:i + 30], api_key, model)
+            for chunk_result in chunk_results:
                 if chunk_result.get("briefing"):
                     paragraphs.append(chunk_result["briefing"])
                     all_links.extend(chunk_result.get("source_links", []))
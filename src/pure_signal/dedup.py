@@ -1,70 +1,142 @@
 """
 Deduplication system for tracking processed Pure Signal content.
-Uses a JSON file as the backing store.
+Uses a SQLite table (primary-key indexed on content ID) as the backing store.
 """
 
-import json
 import logging
+import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_SQL_IN_CHUNK = 900  # stay under SQLite's bound-variable limit
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=60000",
+)
+
 
 class DeduplicationStore:
     """Tracks processed content to avoid duplicates."""
 
-    def __init__(self, store_path: str = "data/pure_signal_processed.json"):
+    def __init__(self, store_path: str = "data/pure_signal_processed.db"):
         self.store_path = Path(store_path)
-        self._ensure_store_exists()
-        self._data = self._load()
-
-    def _ensure_store_exists(self):
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        if not self.store_path.exists():
-            self._save({'processed': {}, 'metadata': {'created': datetime.now(timezone.utc).isoformat()}})
+        self._conn = sqlite3.connect(self.store_path, isolation_level=None)
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS processed (
+                id TEXT PRIMARY KEY,
+                processed_at TEXT,
+                metadata TEXT
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_meta (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                modified TEXT
+            )
+        """)
+        self._migrate_legacy_json()
+
+    def close(self):
+        """Close the database, checkpointing the WAL."""
+        self._conn.close()
+
+    def _migrate_legacy_json(self):
+        """One-shot import of the old JSON store into an empty table."""
+        legacy = self.store_path.with_suffix('.json')
+        if legacy == self.store_path or not legacy.exists():
+            return
+        if self._conn.execute("SELECT 1 FROM processed LIMIT 1").fetchone():
+            return
+        try:
+            processed = orjson.loads(legacy.read_bytes()).get('processed', {})
+        except (orjson.JSONDecodeError, OSError) as e:
+            logger.warning(f"Failed to read legacy store {legacy}: {e}")
+            return
+        self._insert_many(
+            (cid, entry.get('processed_at', ''), orjson.dumps(entry.get('metadata', {})).decode())
+            for cid, entry in processed.items()
+        )
+        logger.info(f"Migrated {len(processed)} processed items from {legacy}")
 
-    def _load(self) -> dict:
+    def _insert_many(self, rows):
+        self._conn.execute("BEGIN")
         try:
-            with open(self.store_path, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            logger.warning(f"Failed to load store, creating new: {e}")
-            return {'processed': {}, 'metadata': {'created': datetime.now(timezone.utc).isoformat()}}
-
-    def _save(self, data: Optional[dict] = None):
-        if data is None:
-            data = self._data
-        data['metadata']['last_updated'] = datetime.now(timezone.utc).isoformat()
-        with open(self.store_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO processed (id, processed_at, metadata) VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def load_feed_validators(self) -> dict:
+        """Return {feed_url: (etag, modified)} saved by the last completed run."""
+        return {
+            url: (etag, modified)
+            for url, etag, modified in self._conn.execute("SELECT url, etag, modified FROM feed_meta")
+        }
+
+    def save_feed_validators(self, validators: dict):
+        if not validators:
+            return
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO feed_meta (url, etag, modified) VALUES (?, ?, ?)",
+                [(url, etag, modified) for url, (etag, modified) in validators.items()],
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
 
     def is_processed(self, content_id: str) -> bool:
-        return content_id in self._data.get('processed', {})
+        row = self._conn.execute(
+            "SELECT EXISTS(SELECT 1 FROM processed WHERE id = ?)", (content_id,)
+        ).fetchone()
+        return bool(row[0])
 
     def mark_processed(self, content_id: str, metadata: Optional[dict] = None):
-        if 'processed' not in self._data:
-            self._data['processed'] = {}
-        self._data['processed'][content_id] = {
-            'processed_at': datetime.now(timezone.utc).isoformat(),
-            'metadata': metadata or {}
-        }
-        self._save()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO processed (id, processed_at, metadata) VALUES (?, ?, ?)",
+            (content_id, datetime.now(timezone.utc).isoformat(), orjson.dumps(metadata or {}).decode()),
+        )
 
     def mark_batch_processed(self, content_ids: list[str], metadata: Optional[dict] = None):
-        if 'processed' not in self._data:
-            self._data['processed'] = {}
         timestamp = datetime.now(timezone.utc).isoformat()
-        for content_id in content_ids:
-            self._data['processed'][content_id] = {
-                'processed_at': timestamp,
-                'metadata': metadata or {}
-            }
-        self._save()
+        meta_json = orjson.dumps(metadata or {}).decode()
+        self._insert_many((content_id, timestamp, meta_json) for content_id in content_ids)
         logger.info(f"Marked {len(content_ids)} items as processed")
 
+    def _processed_subset(self, content_ids: list[str]) -> set[str]:
+        """Return which of content_ids are already processed, one query per chunk."""
+        seen: set[str] = set()
+        for i in range(0, len(content_ids), _SQL_IN_CHUNK):
+            chunk = content_ids[i:i + _SQL_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            seen.update(
+                row[0] for row in self._conn.execute(
+                    f"SELECT id FROM processed WHERE id IN ({placeholders})", chunk
+                )
+            )
+        return seen
+
     def filter_unprocessed(self, items: list) -> list:
-        unprocessed = [item for item in items if not self.is_processed(item.id)]
+        seen = self._processed_subset([item.id for item in items])
+        unprocessed = [item for item in items if item.id not in seen]
         logger.info(f"Filtered {len(items)} items to {len(unprocessed)} unprocessed")
         return unprocessed
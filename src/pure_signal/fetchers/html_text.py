@@ -0,0 +1,42 @@
+"""
+Shared HTML → plain-text cleanup for the fetchers.
+"""
+
+import re
+import threading
+
+from lxml import etree
+from lxml import html as lxml_html
+
+_WS_RE = re.compile(r'\s+')
+_STRIP_TAGS = ('script', 'style', 'nav', 'footer', 'header')
+
+# lxml parsers must not be shared across threads; keep one per fetch worker.
+_local = threading.local()
+
+
+def _parser() -> lxml_html.HTMLParser:
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = lxml_html.HTMLParser(recover=True, remove_comments=True)
+    return parser
+
+
+def clean_html(html: str) -> str:
+    """Strip boilerplate elements and collapse whitespace to a single space."""
+    if not html or html.isspace():
+        return ""
+    try:
+        root = lxml_html.fromstring(html, parser=_parser())
+    except ValueError:
+        # str input with an XML encoding declaration; let lxml decode the bytes
+        root = lxml_html.fromstring(html.encode('utf-8'), parser=_parser())
+    except etree.ParserError:
+        return ""
+    # A fragment like "<nav>menu</nav>" parses to the nav element itself, and
+    # strip_elements never removes the element it is called on
+    if root.tag in _STRIP_TAGS:
+        return ""
+    etree.strip_elements(root, *_STRIP_TAGS, with_tail=False)
+    # Join text nodes with a space so adjacent block elements don't run together
+    return _WS_RE.sub(' ', ' '.join(root.itertext())).strip()
@@ -4,16 +4,37 @@ RSS/Atom feed fetcher for blogs, Substack, and Medium.
 
 import feedparser
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from operator import attrgetter
 from typing import Optional
 from dataclasses import dataclass, field
+from urllib.parse import urlparse
+import threading
 import time
-import re
-from bs4 import BeautifulSoup
+
+from dateutil import parser as dateutil_parser
+
+from .html_text import clean_html
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> datetime:
+    """Parse a feed date string: RFC 2822 fast path, dateutil fallback."""
+    try:
+        dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        dt = dateutil_parser.parse(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 @dataclass
 class ContentItem:
     """Represents a piece of content from any source."""
@@ -51,25 +72,37 @@ class ContentItem:
 class RSSFetcher:
     """Fetches and parses RSS/Atom feeds."""
 
-    def __init__(self, delay_seconds: float = 1.0):
+    def __init__(
+        self,
+        delay_seconds: float = 1.0,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+        feed_validators: Optional[dict] = None,
+    ):
         self.delay_seconds = delay_seconds
-        self._last_request_time = 0
-
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.delay_seconds:
-            time.sleep(self.delay_seconds - elapsed)
-        self._last_request_time = time.time()
-
-    def _clean_html(self, html: str) -> str:
-        if not html:
-            return ""
-        soup = BeautifulSoup(html, 'lxml')
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
-        text = soup.get_text(separator=' ')
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        self.max_workers = max_workers
+        # {feed_url: (etag, modified)} from the previous run; feeds answering
+        # 304 Not Modified are skipped. Fresh validators land in updated_validators.
+        self.feed_validators = feed_validators or {}
+        self.updated_validators: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._host_slots = defaultdict(lambda: threading.Semaphore(per_host_limit))
+        self._last_request_time: dict[str, float] = {}
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore bounding concurrent requests to the URL's host."""
+        with self._lock:
+            return self._host_slots[urlparse(url).netloc]
+
+    def _rate_limit(self, url: str):
+        """Space requests to the same host at least delay_seconds apart."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.time()
+            start = max(now, self._last_request_time.get(host, 0) + self.delay_seconds)
+            self._last_request_time[host] = start
+        if start > now:
+            time.sleep(start - now)
 
     def _parse_date(self, entry: dict) -> Optional[datetime]:
         for field_name in ['published_parsed', 'updated_parsed', 'created_parsed']:
@@ -85,11 +118,7 @@ class RSSFetcher:
         for field_name in ['published', 'updated', 'created']:
             if field_name in entry and entry[field_name]:
                 try:
-                    from dateutil import parser
-                    dt = parser.parse(entry[field_name])
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    return dt
+                    return _parse_date_string(entry[field_name])
                 except Exception as e:
                     logger.debug(f"Failed to parse date string from {field_name}: {e}")
                     continue
@@ -103,14 +132,23 @@ class RSSFetcher:
         source_name: str,
         lookback_hours: int = 24
     ) -> list[ContentItem]:
-        self._rate_limit()
         logger.info(f"Fetching RSS feed: {feed_url}")
+        etag, modified = self.feed_validators.get(feed_url, (None, None))
         try:
-            feed = feedparser.parse(feed_url)
+            with self._host_slot(feed_url):
+                self._rate_limit(feed_url)
+                feed = feedparser.parse(feed_url, etag=etag, modified=modified)
         except Exception as e:
             logger.error(f"Failed to parse feed {feed_url}: {e}")
             return []
 
+        if feed.get('status') == 304:
+            logger.info(f"Feed unchanged since last run: {feed_url}")
+            return []
+        if feed.get('etag') or feed.get('modified'):
+            with self._lock:
+                self.updated_validators[feed_url] = (feed.get('etag'), feed.get('modified'))
+
         if feed.bozo and feed.bozo_exception:
             logger.warning(f"Feed parse warning for {feed_url}: {feed.bozo_exception}")
 
@@ -137,7 +175,7 @@ class RSSFetcher:
             elif 'description' in entry:
                 content_html = entry.description
 
-            content_text = self._clean_html(content_html)
+            content_text = clean_html(content_html)
 
             item = ContentItem(
                 id=entry.get('id', entry.get('link', '')),
@@ -149,7 +187,6 @@ class RSSFetcher:
                 content=content_text,
                 url=entry.get('link', ''),
                 published=pub_date,
-                raw_html=content_html,
                 metadata={
                     'author': entry.get('author', ''),
                     'tags': [tag.get('term', '') for tag in entry.get('tags', [])],
@@ -166,29 +203,35 @@ class RSSFetcher:
         people_config: dict,
         lookback_hours: int = 24
     ) -> list[ContentItem]:
-        all_items = []
+        jobs = []
         for person_id, person_data in people_config.items():
             person_name = person_data.get('name', person_id)
             feeds = person_data.get('rss', [])
             person_lookback = person_data.get('lookback_hours', lookback_hours)
-            if not feeds:
-                continue
-            for feed_config in feeds:
+            for feed_config in feeds or []:
                 feed_url = feed_config.get('url')
-                feed_name = feed_config.get('name', 'Unknown Feed')
                 if not feed_url:
                     continue
-                try:
-                    items = self.fetch_feed(
-                        feed_url=feed_url,
-                        person_id=person_id,
-                        person_name=person_name,
-                        source_name=feed_name,
-                        lookback_hours=person_lookback
-                    )
+                jobs.append(dict(
+                    feed_url=feed_url,
+                    person_id=person_id,
+                    person_name=person_name,
+                    source_name=feed_config.get('name', 'Unknown Feed'),
+                    lookback_hours=person_lookback,
+                ))
+
+        def _fetch(job: dict) -> list[ContentItem]:
+            try:
+                return self.fetch_feed(**job)
+            except Exception as e:
+                logger.error(f"Error fetching feed for {job['person_name']}: {e}")
+                return []
+
+        # Network-bound: fetch feeds concurrently, politeness is enforced per host
+        all_items = []
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs))) as executor:
+                for items in executor.map(_fetch, jobs):
                     all_items.extend(items)
-                except Exception as e:
-                    logger.error(f"Error fetching feed for {person_name}: {e}")
-                    continue
-        all_items.sort(key=lambda x: x.published, reverse=True)
+        all_items.sort(key=attrgetter('published'), reverse=True)
         return all_items
@@ -6,54 +6,73 @@ Searches the web for recent mentions and extracts content.
 """
 
 import logging
-import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import urlparse
 
 from dateutil import parser as dateutil_parser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 from duckduckgo_search import DDGS
 
+from ..dedup import DeduplicationStore
+from .html_text import clean_html
 from .rss_fetcher import ContentItem
 
 logger = logging.getLogger(__name__)
 
+_DDG_URL = "https://duckduckgo.com/"
+
 
 class WebFetcher:
     """Fetches recent content about a person via web search."""
 
-    def __init__(self, delay_seconds: float = 1.0, fetch_timeout: int = 10):
+    def __init__(
+        self,
+        delay_seconds: float = 1.0,
+        fetch_timeout: int = 10,
+        max_workers: int = 8,
+        per_host_limit: int = 2,
+    ):
         self.delay_seconds = delay_seconds
         self.fetch_timeout = fetch_timeout
-        self._last_request_time = 0
-
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.delay_seconds:
-            time.sleep(self.delay_seconds - elapsed)
-        self._last_request_time = time.time()
-
-    def _clean_html(self, html: str) -> str:
-        if not html:
-            return ""
-        soup = BeautifulSoup(html, 'lxml')
-        for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-            element.decompose()
-        text = soup.get_text(separator=' ')
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        self.max_workers = max_workers
+        self._session = requests.Session()
+        self._session.headers['User-Agent'] = 'SignalHub/1.0 (digest bot)'
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._lock = threading.Lock()
+        self._host_slots = defaultdict(lambda: threading.Semaphore(per_host_limit))
+        self._last_request_time: dict[str, float] = {}
+        self._ddgs = DDGS(timeout=fetch_timeout)
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        """Semaphore bounding concurrent requests to the URL's host."""
+        with self._lock:
+            return self._host_slots[urlparse(url).netloc]
+
+    def _rate_limit(self, url: str):
+        """Space requests to the same host at least delay_seconds apart."""
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.time()
+            start = max(now, self._last_request_time.get(host, 0) + self.delay_seconds)
+            self._last_request_time[host] = start
+        if start > now:
+            time.sleep(start - now)
 
     def _fetch_page_text(self, url: str) -> str:
-        self._rate_limit()
         try:
-            resp = requests.get(
-                url,
-                timeout=self.fetch_timeout,
-                headers={'User-Agent': 'SignalHub/1.0 (digest bot)'}
-            )
+            with self._host_slot(url):
+                self._rate_limit(url)
+                resp = self._session.get(url, timeout=self.fetch_timeout)
             resp.raise_for_status()
-            return self._clean_html(resp.text)
+            return clean_html(resp.text)
         except Exception as e:
             logger.debug(f"Failed to fetch {url}: {e}")
             return ""
@@ -64,17 +83,27 @@ class WebFetcher:
         person_name: str,
         search_queries: list[str],
         max_results: int = 5,
+        dedup: Optional[DeduplicationStore] = None,
     ) -> list[ContentItem]:
-        items = []
+        """
+        Search for recent news about a person and fetch each result's page text.
+
+        Results whose URL the dedup store has already processed are dropped
+        before their page is fetched.
+        """
+        candidates = []  # (query, result)
         seen_urls: set[str] = set()
+        skipped = 0
 
         for query in search_queries:
             logger.info(f"Web search: {query}")
-            self._rate_limit()
+            self._rate_limit(_DDG_URL)
             try:
-                results = DDGS().news(query, max_results=max_results)
+                results = self._ddgs.news(query, max_results=max_results)
             except Exception as e:
                 logger.error(f"Web search failed for '{query}': {e}")
+                # Don't reuse a client that may hold broken connection state
+                self._ddgs = DDGS(timeout=self.fetch_timeout)
                 continue
 
             for result in results:
@@ -82,39 +111,54 @@ class WebFetcher:
                 if not url or url in seen_urls:
                     continue
                 seen_urls.add(url)
+                if dedup is not None and dedup.is_processed(url):
+                    skipped += 1
+                    continue
+                candidates.append((query, result))
+
+        if skipped:
+            logger.info(f"Skipped {skipped} already-processed web results for {person_name}")
 
-                title = result.get('title', 'Untitled')
-                snippet = result.get('body', '')
-
-                pub_date = datetime.now(timezone.utc)
-                date_str = result.get('date', '')
-                if date_str:
-                    try:
-                        pub_date = dateutil_parser.parse(date_str)
-                        if pub_date.tzinfo is None:
-                            pub_date = pub_date.replace(tzinfo=timezone.utc)
-                    except (ValueError, TypeError):
-                        pass
-
-                full_text = self._fetch_page_text(url)
-                content = full_text if full_text else snippet
-                if len(content) > 5000:
-                    content = content[:5000]
-
-                item = ContentItem(
-                    id=url,
-                    person_id=person_id,
-                    person_name=person_name,
-                    source='web_search',
-                    source_name=f'Web Search: {query}',
-                    title=title,
-                    content=content,
-                    url=url,
-                    published=pub_date,
-                    metadata={'search_query': query, 'snippet': snippet},
-                )
-                items.append(item)
-                logger.info(f"Found web result: {title}")
+        # Page fetches are network-bound; fan out across hosts
+        page_texts = []
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(candidates))) as executor:
+                page_texts = list(executor.map(self._fetch_page_text, [r['url'] for _, r in candidates]))
+
+        items = []
+        for (query, result), full_text in zip(candidates, page_texts):
+            url = result['url']
+            title = result.get('title', 'Untitled')
+            snippet = result.get('body', '')
+
+            pub_date = datetime.now(timezone.utc)
+            date_str = result.get('date', '')
+            if date_str:
+                try:
+                    pub_date = dateutil_parser.parse(date_str)
+                    if pub_date.tzinfo is None:
+                        pub_date = pub_date.replace(tzinfo=timezone.utc)
+                except (ValueError, TypeError):
+                    pass
+
+            content = full_text if full_text else snippet
+            if len(content) > 5000:
+                content = content[:5000]
+
+            item = ContentItem(
+                id=url,
+                person_id=person_id,
+                person_name=person_name,
+                source='web_search',
+                source_name=f'Web Search: {query}',
+                title=title,
+                content=content,
+                url=url,
+                published=pub_date,
+                metadata={'search_query': query, 'snippet': snippet},
+            )
+            items.append(item)
+            logger.info(f"Found web result: {title}")
 
         logger.info(f"Web search found {len(items)} items for {person_name}")
         return items
@@ -5,11 +5,17 @@ Fetches RSS feeds and web search results for configured AI researchers,
 deduplicates, and synthesizes a TTS-optimized narrative digest via Claude.
 
 Returns the digest as a markdown string (does not build site or deploy).
+backfill() re-synthesizes past days through the Message Batches API.
 """
 
+import heapq
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, time, timedelta, timezone
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional
+from zoneinfo import ZoneInfo
 
 from .fetchers.rss_fetcher import RSSFetcher, ContentItem
 from .fetchers.web_fetcher import WebFetcher
@@ -18,6 +24,9 @@ from .synthesizer import DigestSynthesizer
 
 log = logging.getLogger(__name__)
 
+# Archive days are filed under this zone (see main.py)
+_ARCHIVE_TZ = ZoneInfo("America/New_York")
+
 
 def run(
     people_config: dict,
@@ -28,6 +37,11 @@ def run(
     temperature: float = 0.7,
     lookback_hours: int = 24,
     rss_delay: float = 1.0,
+    haiku_model: Optional[str] = "claude-haiku-4-5",
+    router_threshold_chars: int = 8000,
+    tokens_per_item: int = 200,
+    min_tokens: int = 1500,
+    synth_cache_dir: Optional[Path] = None,
 ) -> str:
     """
     Run the Pure Signal pipeline.
@@ -35,12 +49,17 @@ def run(
     Args:
         people_config:    Dict of people + sources from config.yaml
         api_key:          Anthropic API key
-        dedup_path:       Path to the JSON deduplication store
+        dedup_path:       Path to the SQLite deduplication store
         synthesis_model:  Claude model ID
         max_tokens:       Max tokens for synthesis response
         temperature:      Sampling temperature
         lookback_hours:   Global lookback window (per-person overrides in config)
-        rss_delay:        Seconds to wait between RSS requests
+        rss_delay:        Seconds to wait between RSS requests to the same host
+        haiku_model:      Smaller model used on quiet days (None to always use synthesis_model)
+        router_threshold_chars: Total content size below which haiku_model is used
+        tokens_per_item:  Output-token budget per item (capped at max_tokens)
+        min_tokens:       Output-token floor for small days
+        synth_cache_dir:  Directory caching finished digests by request (None disables)
 
     Returns:
         Markdown-formatted digest string, or "" if nothing to report.
@@ -48,64 +67,146 @@ def run(
     log.info("=== Pure Signal pipeline ===")
 
     dedup = DeduplicationStore(str(dedup_path))
-    rss_fetcher = RSSFetcher(delay_seconds=rss_delay)
-    web_fetcher = WebFetcher(delay_seconds=1.0)
-
-    all_items: list[ContentItem] = []
-
-    # RSS feeds
-    log.info("Fetching RSS content …")
-    rss_items = rss_fetcher.fetch_all_feeds(people_config, lookback_hours)
-    all_items.extend(rss_items)
-    log.info("Found %d RSS items", len(rss_items))
-
-    # Web search (for people with web_search config block)
-    for person_id, person_data in people_config.items():
-        ws_config = person_data.get("web_search")
-        if not ws_config:
-            continue
-        person_name = person_data.get("name", person_id)
-        queries = ws_config.get("queries", [])
-        max_results = ws_config.get("max_results", 5)
-        if not queries:
-            continue
-        log.info("Web search for %s …", person_name)
-        try:
-            ws_items = web_fetcher.fetch_for_person(
-                person_id=person_id,
-                person_name=person_name,
-                search_queries=queries,
-                max_results=max_results,
+    try:
+        rss_fetcher = RSSFetcher(
+            delay_seconds=rss_delay,
+            feed_validators=dedup.load_feed_validators(),
+        )
+        web_fetcher = WebFetcher(delay_seconds=1.0)
+
+        # RSS feeds (returned newest-first)
+        log.info("Fetching RSS content …")
+        rss_items = rss_fetcher.fetch_all_feeds(people_config, lookback_hours)
+        log.info("Found %d RSS items", len(rss_items))
+
+        # Web search (for people with web_search config block)
+        web_items: list[ContentItem] = []
+        for person_id, person_data in people_config.items():
+            ws_config = person_data.get("web_search")
+            if not ws_config:
+                continue
+            person_name = person_data.get("name", person_id)
+            queries = ws_config.get("queries", [])
+            max_results = ws_config.get("max_results", 5)
+            if not queries:
+                continue
+            log.info("Web search for %s …", person_name)
+            try:
+                ws_items = web_fetcher.fetch_for_person(
+                    person_id=person_id,
+                    person_name=person_name,
+                    search_queries=queries,
+                    max_results=max_results,
+                    dedup=dedup,
+                )
+                web_items.extend(ws_items)
+            except Exception as e:
+                log.error("Web search failed for %s: %s", person_name, e)
+
+        # Both streams newest-first, so a linear merge replaces a full re-sort
+        by_published = attrgetter("published")
+        web_items.sort(key=by_published, reverse=True)
+        all_items: list[ContentItem] = list(heapq.merge(rss_items, web_items, key=by_published, reverse=True))
+
+        # Feed ETag/Last-Modified validators are only persisted once this run's
+        # items are safely processed, so a failed synthesis never hides them
+        # behind a 304 on the next run.
+        if not all_items:
+            log.info("No content found — quiet day for Pure Signal")
+            dedup.save_feed_validators(rss_fetcher.updated_validators)
+            return ""
+
+        unprocessed = dedup.filter_unprocessed(all_items)
+        if not unprocessed:
+            log.info("All content already processed — quiet day for Pure Signal")
+            dedup.save_feed_validators(rss_fetcher.updated_validators)
+            return ""
+
+        log.info("Synthesizing %d new Pure Signal items …", len(unprocessed))
+
+        synthesizer = DigestSynthesizer(
+            api_key=api_key,
+            model=synthesis_model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            haiku_model=haiku_model,
+            router_threshold_chars=router_threshold_chars,
+            tokens_per_item=tokens_per_item,
+            min_tokens=min_tokens,
+            cache_dir=str(synth_cache_dir) if synth_cache_dir else None,
+        )
+        digest = synthesizer.synthesize(unprocessed)
+
+        if digest:
+            dedup.mark_batch_processed(
+                [item.id for item in unprocessed],
+                {"digest_date": datetime.now(timezone.utc).isoformat()},
             )
-            all_items.extend(ws_items)
-        except Exception as e:
-            log.error("Web search failed for %s: %s", person_name, e)
+            dedup.save_feed_validators(rss_fetcher.updated_validators)
 
-    all_items.sort(key=lambda x: x.published, reverse=True)
+        return digest
+    finally:
+        dedup.close()
 
-    if not all_items:
-        log.info("No content found — quiet day for Pure Signal")
-        return ""
 
-    unprocessed = dedup.filter_unprocessed(all_items)
-    if not unprocessed:
-        log.info("All content already processed — quiet day for Pure Signal")
-        return ""
+def backfill(
+    people_config: dict,
+    api_key: str,
+    days: int,
+    synthesis_model: str = "claude-sonnet-4-6",
+    max_tokens: int = 8000,
+    temperature: float = 0.7,
+    rss_delay: float = 1.0,
+    haiku_model: Optional[str] = "claude-haiku-4-5",
+    router_threshold_chars: int = 8000,
+    tokens_per_item: int = 200,
+    min_tokens: int = 1500,
+) -> dict[str, str]:
+    """
+    Re-synthesize the Pure Signal digest for each of the past `days` days.
 
-    log.info("Synthesizing %d new Pure Signal items …", len(unprocessed))
+    RSS items still present in the feeds are grouped by the archive day they
+    were published on and submitted as one Message Batches request (half
+    price, but may take minutes to hours). Today is left to the daily run,
+    and the dedup store is neither consulted nor updated.
+
+    Returns:
+        {"YYYY-MM-DD": digest} for every day that produced one.
+    """
+    log.info("=== Pure Signal backfill (%d days) ===", days)
+
+    today = datetime.now(_ARCHIVE_TZ).date()
+    first_day = today - timedelta(days=days)
+    # Fetch the whole window regardless of per-person lookbacks, and without
+    # the daily run's ETag validators so unchanged feeds are not skipped
+    rss_fetcher = RSSFetcher(delay_seconds=rss_delay)
+    lookback_hours = (days + 1) * 24
+    items = rss_fetcher.fetch_all_feeds(
+        {pid: {**person, "lookback_hours": lookback_hours} for pid, person in people_config.items()},
+        lookback_hours,
+    )
+
+    def archive_day(item: ContentItem):
+        return item.published.astimezone(_ARCHIVE_TZ).date()
+
+    # Items arrive newest-first, so each day's items are contiguous
+    batch_days = [
+        (datetime.combine(day, time(), tzinfo=_ARCHIVE_TZ), list(group))
+        for day, group in groupby(items, key=archive_day)
+        if first_day <= day < today
+    ]
+    if not batch_days:
+        log.info("No backfill content found")
+        return {}
 
     synthesizer = DigestSynthesizer(
         api_key=api_key,
         model=synthesis_model,
         max_tokens=max_tokens,
         temperature=temperature,
+        haiku_model=haiku_model,
+        router_threshold_chars=router_threshold_chars,
+        tokens_per_item=tokens_per_item,
+        min_tokens=min_tokens,
     )
-    digest = synthesizer.synthesize(unprocessed)
-
-    if digest:
-        dedup.mark_batch_processed(
-            [item.id for item in unprocessed],
-            {"digest_date": datetime.now(timezone.utc).isoformat()},
-        )
-
-    return digest
+    return synthesizer.synthesize_batch(batch_days)
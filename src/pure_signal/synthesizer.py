@@ -2,13 +2,58 @@
 AI-powered content synthesis using Claude API — Pure Signal persona.
 """
 
+import hashlib
 import logging
+import os
+import re
+import time
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from itertools import chain, groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from zoneinfo import ZoneInfo
 import anthropic
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+ROUTER_MIN_ITEMS = 5   # fewer items than this always routes to the small model
+BATCH_POLL_INITIAL_SECONDS = 10
+BATCH_POLL_MAX_SECONDS = 300
+CLIENT_MAX_CONNECTIONS = 20
+RESULT_CACHE_MAX_AGE_DAYS = 7
+BASE_OUTPUT_TOKENS = 1000   # opening hook, transitions and closing thought
+
+_person_id = attrgetter("person_id")
+_WS_RE = re.compile(r"\s+")
+
+
+def _drain(gen) -> tuple[str, object]:
+    """Join a generator's text chunks and also return its return value."""
+    chunks = []
+    while True:
+        try:
+            chunks.append(next(gen))
+        except StopIteration as stop:
+            return "".join(chunks), stop.value
+
+
+@lru_cache(maxsize=None)
+def _shared_client(api_key: str) -> anthropic.Anthropic:
+    """One client (and connection pool) per API key for the life of the process."""
+    return anthropic.Anthropic(
+        api_key=api_key,
+        http_client=anthropic.DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=CLIENT_MAX_CONNECTIONS,
+            ),
+        ),
+    )
+
 
 class DigestSynthesizer:
     """
@@ -85,45 +130,88 @@ FORMAT YOUR OUTPUT AS:
         api_key: str,
         model: str = "claude-sonnet-4-6",
         max_tokens: int = 8000,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        haiku_model: Optional[str] = "claude-haiku-4-5",
+        router_threshold_chars: int = 8000,
+        client: Optional[anthropic.Anthropic] = None,
+        cache_dir: Optional[str] = None,
+        tokens_per_item: int = 200,
+        min_tokens: int = 1500
     ):
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = client if client is not None else _shared_client(api_key)
         self.model = model
         self.max_tokens = max_tokens
         self.temperature = temperature
+        self.haiku_model = haiku_model
+        self.router_threshold_chars = router_threshold_chars
+        self.tokens_per_item = tokens_per_item
+        self.min_tokens = min_tokens
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._purge_result_cache()
+
+    # ------ Result cache: finished digests keyed by the exact request ------
+
+    def _purge_result_cache(self):
+        cutoff = time.time() - RESULT_CACHE_MAX_AGE_DAYS * 86400
+        for path in self.cache_dir.glob("*.md"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def _cache_path(self, params: dict) -> Path:
+        # params carries model, max_tokens, temperature, system and the dated prompt
+        key = hashlib.sha256(orjson.dumps(params, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        return self.cache_dir / f"{key}.md"
+
+    def _cache_get(self, params: dict) -> Optional[str]:
+        try:
+            return self._cache_path(params).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _cache_put(self, params: dict, digest: str):
+        path = self._cache_path(params)
+        tmp_path = path.with_suffix(".md.tmp")
+        tmp_path.write_text(digest, encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _route(self, items: list) -> tuple[str, int, int]:
+        """
+        Pick (model, max_tokens, cap) for a request.
+
+        Quiet days go to the small model with half the output cap, and the
+        ceiling is further scaled to the item count: a handful of items never
+        needs the full budget. cap is the routed model's ceiling, the most a
+        truncation retry may ask for.
+        """
+        model, cap = self.model, self.max_tokens
+        if self.haiku_model:
+            total_chars = sum(len(item.content) for item in items)
+            if len(items) < ROUTER_MIN_ITEMS or total_chars < self.router_threshold_chars:
+                model, cap = self.haiku_model, max(self.max_tokens // 2, 1024)
+        budget = max(self.min_tokens, self.tokens_per_item * len(items) + BASE_OUTPUT_TOKENS)
+        return model, min(cap, budget), cap
 
     def _format_content_for_synthesis(self, items: list) -> str:
-        by_person = {}
-        for item in items:
-            if item.person_id not in by_person:
-                by_person[item.person_id] = {'name': item.person_name, 'items': []}
-            by_person[item.person_id]['items'].append(item)
-
+        # Stable sort: each person's items keep their incoming order
         sections = []
-        for person_id, data in by_person.items():
-            person_section = f"\n## {data['name']}\n"
-            for item in data['items']:
-                person_section += f"\n### {item.title}\n"
-                person_section += f"Source: {item.source_name}\n"
-                person_section += f"Published: {item.published.strftime('%Y-%m-%d %H:%M UTC')}\n"
-                person_section += f"\n{item.content}\n"
-            sections.append(person_section)
+        for _, group in groupby(sorted(items, key=_person_id), key=_person_id):
+            first = next(group)
+            parts = ["\n## ", first.person_name, "\n"]
+            for item in chain((first,), group):
+                # No source/published lines: the digest omits metadata anyway
+                parts.extend(("\n### ", _WS_RE.sub(" ", item.title).strip(), "\n\n", item.content, "\n"))
+            sections.append("".join(parts))
 
         return "\n---\n".join(sections)
 
-    def synthesize(self, items: list, date: Optional[datetime] = None) -> str:
-        if not items:
-            logger.info("No content to synthesize")
-            return ""
-
-        if date is None:
-            date = datetime.now()
-
+    def _build_user_prompt(self, items: list, date_human: str) -> str:
         formatted_content = self._format_content_for_synthesis(items)
-        people_count = len(set(item.person_id for item in items))
-        logger.info(f"Synthesizing {len(items)} items from {people_count} people")
-
-        user_prompt = f"""Today's date: {date.strftime('%B %d, %Y')}
+        return f"""Today's date: {date_human}
 
 Here is the content from the past 24 hours to synthesize into today's digest:
 
@@ -136,25 +224,190 @@ Create the daily digest following all the rules in your instructions. Remember:
 - Keep sentences short and punchy
 - Include smooth inline definitions for technical terms"""
 
+    def _request_params(self, items: list, date: datetime) -> tuple[dict, int]:
+        """Return the API request for a day and the routed model's output cap."""
+        model, max_tokens, cap = self._route(items)
+        params = {
+            "model": model,
+            "max_tokens": max_tokens,
+            "temperature": self.temperature,
+            # No cache_control: the system prompt is below the 1024-token caching minimum
+            "system": self.SYSTEM_PROMPT,
+            "messages": [{"role": "user", "content": self._build_user_prompt(items, f"{date:%B %d, %Y}")}],
+        }
+        return params, cap
+
+    def _prepare(self, items: list, date: Optional[datetime]) -> Optional[tuple[dict, int]]:
+        if not items:
+            logger.info("No content to synthesize")
+            return None
+
+        if date is None:
+            # Same zone main.py files the archive under, independent of the host's timezone
+            date = datetime.now(ZoneInfo("America/New_York"))
+
+        people_count = len(set(item.person_id for item in items))
+        logger.info(f"Synthesizing {len(items)} items from {people_count} people")
+        return self._request_params(items, date)
+
+    def _replay_cached(self, params: dict, on_delta: Optional[Callable[[str], None]]) -> Optional[str]:
+        cached = self._cache_get(params)
+        if cached is not None:
+            logger.info("Pure Signal synthesis served from result cache")
+            if on_delta is not None:
+                on_delta(cached)
+        return cached
+
+    def _stream_attempt(self, params: dict, on_delta: Optional[Callable[[str], None]]):
+        """Yield text deltas for one API call; the generator returns the final message."""
+        model, max_tokens = params["model"], params["max_tokens"]
         try:
-            logger.info(f"Calling Claude API ({self.model})")
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=self.SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": user_prompt}]
-            )
-            digest = response.content[0].text
+            logger.info(f"Calling Claude API ({model}, max_tokens={max_tokens})")
+            with self.client.messages.stream(**params) as stream:
+                for text in stream.text_stream:
+                    if on_delta is not None:
+                        on_delta(text)
+                    yield text
+                response = stream.get_final_message()
             logger.info(
-                f"Pure Signal synthesis complete. "
+                f"Pure Signal synthesis complete ({model}, max_tokens={max_tokens}). "
                 f"Input tokens: {response.usage.input_tokens}, "
                 f"Output tokens: {response.usage.output_tokens}"
             )
-            return digest
+            return response
         except anthropic.APIError as e:
             logger.error(f"Anthropic API error: {e}")
             raise
         except Exception as e:
             logger.error(f"Synthesis failed: {e}")
             raise
+
+    @staticmethod
+    def _truncated(response, params: dict) -> bool:
+        if response.stop_reason != "max_tokens":
+            return False
+        logger.warning(
+            f"Pure Signal digest hit max_tokens={params['max_tokens']} and is truncated; it will not be cached"
+        )
+        return True
+
+    def synthesize_stream(
+        self,
+        items: list,
+        date: Optional[datetime] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
+    ) -> Iterator[str]:
+        """
+        Yield digest text as it is generated.
+
+        on_delta, if given, is called with each text chunk as well, so a caller
+        can start downstream work (e.g. TTS) before the digest is complete.
+        With a cache_dir and use_cache, an identical earlier request is replayed
+        from disk as a single chunk instead of calling the API.
+
+        Text already yielded can't be taken back, so unlike synthesize() a
+        digest truncated at the adaptive ceiling is not retried here.
+        """
+        prepared = self._prepare(items, date)
+        if prepared is None:
+            return
+        params, _ = prepared
+
+        use_cache = use_cache and self.cache_dir is not None
+        if use_cache:
+            cached = self._replay_cached(params, on_delta)
+            if cached is not None:
+                yield cached
+                return
+
+        response = yield from self._stream_attempt(params, on_delta)
+        if use_cache and not self._truncated(response, params):
+            self._cache_put(params, "".join(block.text for block in response.content if block.type == "text"))
+
+    def synthesize(
+        self,
+        items: list,
+        date: Optional[datetime] = None,
+        on_delta: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True
+    ) -> str:
+        """
+        Return the full digest.
+
+        If the digest is cut off at the adaptive max_tokens ceiling, it is
+        regenerated once on the same model at that model's routed cap (so a
+        quiet day on the small model stays within its halved budget); on_delta
+        then sees the truncated attempt followed by the retry.
+        """
+        prepared = self._prepare(items, date)
+        if prepared is None:
+            return ""
+        params, cap = prepared
+
+        use_cache = use_cache and self.cache_dir is not None
+        if use_cache:
+            cached = self._replay_cached(params, on_delta)
+            if cached is not None:
+                return cached
+
+        digest, response = _drain(self._stream_attempt(params, on_delta))
+        if response.stop_reason == "max_tokens" and params["max_tokens"] < cap:
+            logger.warning(
+                f"Pure Signal digest hit max_tokens={params['max_tokens']}; "
+                f"retrying once on {params['model']} with its routed cap max_tokens={cap}"
+            )
+            retry_params = {**params, "max_tokens": cap}
+            digest, response = _drain(self._stream_attempt(retry_params, on_delta))
+            truncated = self._truncated(response, retry_params)
+        else:
+            truncated = self._truncated(response, params)
+
+        # Stored under the original request so an identical rerun finds it
+        if use_cache and not truncated:
+            self._cache_put(params, digest)
+        return digest
+
+    def synthesize_batch(self, days: list[tuple[datetime, list]]) -> dict[str, str]:
+        """
+        Synthesize several days at once through the Message Batches API.
+
+        Intended for backfills, not the daily run: batches are billed at half
+        price but may take minutes to hours to complete.
+
+        Args:
+            days: (date, items) pairs; days with no items are skipped
+
+        Returns:
+            {"YYYY-MM-DD": digest} for every day that succeeded
+        """
+        requests = [
+            {"custom_id": f"digest-{date:%Y-%m-%d}", "params": self._request_params(items, date)[0]}
+            for date, items in days if items
+        ]
+        if not requests:
+            logger.info("No content to synthesize")
+            return {}
+
+        try:
+            batch = self.client.messages.batches.create(requests=requests)
+            logger.info(f"Submitted synthesis batch {batch.id} ({len(requests)} days)")
+
+            delay = BATCH_POLL_INITIAL_SECONDS
+            while batch.processing_status != "ended":
+                time.sleep(delay)
+                delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+                batch = self.client.messages.batches.retrieve(batch.id)
+
+            digests = {}
+            for entry in self.client.messages.batches.results(batch.id):
+                date_str = entry.custom_id.removeprefix("digest-")
+                if entry.result.type != "succeeded":
+                    logger.warning(f"Batch synthesis for {date_str} {entry.result.type}")
+                    continue
+                digests[date_str] = entry.result.message.content[0].text
+            logger.info(f"Synthesis batch {batch.id} complete: {len(digests)}/{len(requests)} days succeeded")
+            return digests
+        except anthropic.APIError as e:
+            logger.error(f"Anthropic API error: {e}")
+            raise
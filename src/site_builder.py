@@ -11,20 +11,122 @@ Site output:
   site/archive/index.html  — archive listing
   site/archive/YYYY-MM-DD.html — individual day pages
   site/style.css
+Render cache:  data/site_cache/html/YYYY-MM-DD.json (section HTML keyed by content hash)
 """
 
-import json
+import hashlib
 import logging
+import os
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from html import escape
 from pathlib import Path
 
+import orjson
+
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _APPLE_TOUCH_ICON_SRC = _PROJECT_ROOT / "SignalHubIcon.jpg"
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever _md_to_html / _maranello_to_html output changes, so cached
+# HTML rendered by the old code is discarded rather than served.
+_RENDER_CACHE_VERSION = 2
+# Bump the first element whenever the day-page template changes, so every page is rewritten.
+# Page hashes are also keyed on the render version, since cached sections feed the pages.
+_PAGE_CACHE_VERSION = [1, _RENDER_CACHE_VERSION]
+_SUMMARY_INDEX_VERSION = 1
+
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\n+")
+
+_MD_HR_RE = re.compile(r"^---+\s*$", re.MULTILINE)
+_MD_HEADER_RE = re.compile(r"^(#{1,3}) (.+)$", re.MULTILINE)
+_MD_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_MD_ITALIC_RE = re.compile(r"\*(.+?)\*")
+
+# Bounded so huge archives don't exhaust file descriptors
+_BUILD_WORKERS = min(32, os.cpu_count() or 4)
+
+_PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1">
+  <title>{title}</title>
+  <link rel="apple-touch-icon" href="/apple-touch-icon.jpg">
+  <link rel="stylesheet" href="{css_path}">
+</head>
+<body>
+  <nav>
+    <a href="/" class="nav-brand">Signal Hub</a>
+    <a href="/archive/">Archive</a>
+  </nav>
+  <main>
+"""
+_PAGE_FOOT = b"""
+  </main>
+</body>
+</html>"""
+
+_PS_SECTION_OPEN = b"""
+    <section class="section pure-signal-section">
+      <h2 class="section-title pure-signal-title">
+        <span class="dot ps-dot"></span> Pure Signal
+        <span class="section-sub">AI Intelligence</span>
+      </h2>
+      <div class="section-body">
+"""
+_HN_SECTION_OPEN = b"""
+      </div>
+    </section>
+
+    <section class="section hn-signal-section">
+      <h2 class="section-title hn-signal-title">
+        <span class="dot hn-dot"></span> HN Signal
+        <span class="section-sub">Hacker News</span>
+      </h2>
+      <div class="section-body">
+"""
+_MAR_SECTION_OPEN = b"""
+      </div>
+    </section>
+
+    <section class="section maranello-section">
+      <h2 class="section-title maranello-title">
+        <span class="dot mar-dot"></span> Maranello Signal
+        <span class="section-sub">Ferrari F1</span>
+      </h2>
+      <div class="section-body">
+"""
+_SECTION_CLOSE = b"""
+      </div>
+    </section>"""
+
+# writev() is POSIX-only and capped at IOV_MAX buffers (16 is the POSIX minimum)
+_HAS_WRITEV = hasattr(os, "writev")
+_IOV_MAX = os.sysconf("SC_IOV_MAX") if "SC_IOV_MAX" in getattr(os, "sysconf_names", {}) else 16
+
+
+def _md_header(m: re.Match) -> str:
+    level = len(m.group(1))
+    return f"<h{level}>{m.group(2)}</h{level}>"
+
+
+def _write_parts(path: Path, parts: list[bytes]) -> None:
+    """Write parts to path, with a single scatter-gather write where the OS supports it."""
+    total = sum(map(len, parts))
+    with open(path, "wb", buffering=0) as f:
+        written = os.writev(f.fileno(), parts) if _HAS_WRITEV and len(parts) <= _IOV_MAX else 0
+        if written < total:
+            # Short or unavailable writev: finish with plain writes
+            remaining = memoryview(b"".join(parts))[written:]
+            while remaining:
+                remaining = remaining[f.write(remaining):]
+
 
 class SiteBuilder:
     """Builds the combined Signal Hub static site."""
@@ -32,6 +134,11 @@ class SiteBuilder:
     def __init__(self, site_dir: str, archive_dir: str):
         self.site_dir = Path(site_dir)
         self.archive_dir = Path(archive_dir)
+        # Kept beside the archive rather than in site/, which is deployed as-is
+        self.cache_dir = self.archive_dir.parent / "site_cache"
+        self.render_cache_dir = self.cache_dir / "html"
+        self.pages_cache_path = self.cache_dir / "pages.json"
+        self.summaries_path = self.cache_dir / "archive_index.json"
 
     # ------------------------------------------------------------------
     # Public API
@@ -61,17 +168,41 @@ class SiteBuilder:
             "hn_signal": hn_signal,
         }
         out_path = self.archive_dir / f"{date_str}.json"
-        out_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        # Write-then-rename so a crash mid-write never leaves a truncated archive
+        tmp_path = out_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, out_path)
         logger.info("Saved combined archive: %s", out_path)
 
-    def build(self) -> None:
+        summaries = self._load_summaries()
+        summaries[date_str] = self._entry_summary(payload)
+        self._save_summaries(summaries)
+
+    def load_archive_entry(self, date_str: str) -> dict | None:
+        """Return the saved archive entry for a day, or None if there isn't one."""
+        path = self.archive_dir / f"{date_str}.json"
+        if not path.exists():
+            return None
+        return self._read_archive_file(path)
+
+    def build(self, full_rebuild: bool = False, changed_dates: set[str] | None = None) -> None:
         """
         Build (or rebuild) the full static site from the JSON archive.
         Call after save_combined_archive() to publish the latest digest.
+
+        Day pages whose archive entry is unchanged since the last build are
+        skipped unless full_rebuild is set. Passing changed_dates (e.g. just
+        the date that was saved) goes further: only those days and the latest
+        one are read from the archive, and the archive listing is built from
+        the summary index kept by save_combined_archive().
         """
         self.site_dir.mkdir(parents=True, exist_ok=True)
         (self.site_dir / "archive").mkdir(parents=True, exist_ok=True)
 
+        if changed_dates is not None and not full_rebuild:
+            self._build_changed(changed_dates)
+            return
+
         entries = self._load_archive()
 
         if not entries:
@@ -81,13 +212,87 @@ class SiteBuilder:
         self._write_css()
         self._copy_apple_touch_icon()
 
+        built_hashes = {} if full_rebuild else (self._load_page_hashes() or {})
+        page_hashes = {}
+        stale = []
         for entry in entries:
-            self._build_day_page(entry, css_path="../style.css")
-
+            date_str = entry.get("date", "unknown")
+            page_hashes[date_str] = self._entry_hash(entry)
+            if (
+                built_hashes.get(date_str) != page_hashes[date_str]
+                or not (self.site_dir / "archive" / f"{date_str}.html").exists()
+            ):
+                stale.append(entry)
+
+        # Day pages are independent; list() re-raises any worker exception
+        with ThreadPoolExecutor(max_workers=_BUILD_WORKERS) as executor:
+            list(executor.map(partial(self._build_day_page, css_path="../style.css"), stale))
+
+        summaries = {entry.get("date", ""): self._entry_summary(entry) for entry in entries}
         self._build_index(entries[0])
-        self._build_archive_index(entries)
+        self._build_archive_index(list(summaries.items()))
+        self._prune_render_cache(set(page_hashes))
+        self._write_cache_file(self.pages_cache_path, {"version": _PAGE_CACHE_VERSION, "pages": page_hashes})
+        self._save_summaries(summaries)
+
+        logger.info("Site built: %d day(s) in archive, %d page(s) rewritten", len(entries), len(stale))
+
+    def _build_changed(self, changed_dates: set[str]) -> None:
+        """
+        Rebuild changed_dates, the home page and the archive listing, plus any
+        listed day whose page is missing from site/ (e.g. on a fresh host).
+        """
+        paths = sorted(self.archive_dir.glob("*.json"), reverse=True) if self.archive_dir.exists() else []
+        if not paths:
+            logger.warning("No archive entries found — nothing to build")
+            return
+
+        page_hashes = self._load_page_hashes()
+        if page_hashes is None:
+            # No page record, or template/renderer changed since: every page may be stale
+            logger.info("Page cache missing or outdated — running a full build")
+            self.build()
+            return
+
+        built_pages = {p.stem for p in (self.site_dir / "archive").glob("*.html")}
+        to_build = set(changed_dates) | {p.stem for p in paths if p.stem not in built_pages}
+
+        summaries = self._load_summaries()
+        # Days missing from the summary index (e.g. archived before it existed) are read once to backfill it
+        wanted = to_build | {paths[0].stem} | {p.stem for p in paths if p.stem not in summaries}
+        to_read = [p for p in paths if p.stem in wanted]
+        with ThreadPoolExecutor(max_workers=_BUILD_WORKERS) as executor:
+            loaded = {
+                p.stem: data
+                for p, data in zip(to_read, executor.map(self._read_archive_file, to_read))
+                if data is not None
+            }
+        for date_str, entry in loaded.items():
+            summaries[date_str] = self._entry_summary(entry)
+
+        latest = next((loaded[p.stem] for p in paths if p.stem in loaded), None)
+        if latest is None:
+            logger.warning("Latest archive entry unreadable — falling back to a full build")
+            self.build()
+            return
+
+        self._write_css()
+        self._copy_apple_touch_icon()
+
+        changed = [loaded[d] for d in sorted(to_build, reverse=True) if d in loaded]
+        with ThreadPoolExecutor(max_workers=_BUILD_WORKERS) as executor:
+            list(executor.map(partial(self._build_day_page, css_path="../style.css"), changed))
+
+        present = [p.stem for p in paths if p.stem in summaries]
+        self._build_index(latest)
+        self._build_archive_index([(d, summaries[d]) for d in present])
 
-        logger.info("Site built: %d day(s) in archive", len(entries))
+        for entry in changed:
+            page_hashes[entry.get("date", "unknown")] = self._entry_hash(entry)
+        self._write_cache_file(self.pages_cache_path, {"version": _PAGE_CACHE_VERSION, "pages": page_hashes})
+        self._save_summaries({d: summaries[d] for d in present})
+
+        logger.info("Site built: %d day(s) in archive, %d page(s) rewritten", len(present), len(changed))
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -95,16 +300,122 @@ class SiteBuilder:
 
     def _load_archive(self) -> list[dict]:
         """Load all archive JSON files, sorted newest-first."""
-        entries = []
         if not self.archive_dir.exists():
-            return entries
-        for path in sorted(self.archive_dir.glob("*.json"), reverse=True):
-            try:
-                data = json.loads(path.read_text(encoding="utf-8"))
-                entries.append(data)
-            except Exception as e:
-                logger.warning("Failed to read %s: %s", path, e)
-        return entries
+            return []
+        # Filenames are ISO dates, so a reverse lexicographic sort is newest-first
+        paths = sorted(self.archive_dir.glob("*.json"), reverse=True)
+        with ThreadPoolExecutor(max_workers=_BUILD_WORKERS) as executor:
+            return [data for data in executor.map(self._read_archive_file, paths) if data is not None]
+
+    @staticmethod
+    def _read_archive_file(path: Path) -> dict | None:
+        try:
+            return orjson.loads(path.read_bytes())
+        except Exception as e:
+            logger.warning("Failed to read %s: %s", path, e)
+            return None
+
+    @staticmethod
+    def _read_cache_file(path: Path, version, key: str) -> dict:
+        """Return data[key] from a versioned cache file, or {} if missing/stale/unreadable."""
+        try:
+            data = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable build cache %s: %s", path, e)
+            return {}
+        return data.get(key, {}) if data.get("version") == version else {}
+
+    @staticmethod
+    def _write_cache_file(path: Path, data: dict) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(data))
+        os.replace(tmp_path, path)
+
+    def _prune_render_cache(self, dates: set[str]) -> None:
+        """Drop cached section HTML for days no longer in the archive."""
+        # Superseded by the per-day files below
+        (self.cache_dir / "md_index.json").unlink(missing_ok=True)
+        if not self.render_cache_dir.exists():
+            return
+        for path in self.render_cache_dir.glob("*.json"):
+            if path.stem not in dates:
+                path.unlink(missing_ok=True)
+
+    def _load_summaries(self) -> dict[str, dict]:
+        return self._read_cache_file(self.summaries_path, _SUMMARY_INDEX_VERSION, "days")
+
+    def _save_summaries(self, summaries: dict[str, dict]) -> None:
+        self._write_cache_file(self.summaries_path, {"version": _SUMMARY_INDEX_VERSION, "days": summaries})
+
+    @staticmethod
+    def _entry_summary(entry: dict) -> dict:
+        """Which sections a day has; all the archive listing needs."""
+        return {
+            "has_ps": bool(entry.get("pure_signal", "").strip()),
+            "has_hn": bool(entry.get("hn_signal", "").strip()),
+            "has_mar": bool(entry.get("maranello", {}).get("briefing", "").strip()),
+        }
+
+    def _load_page_hashes(self) -> dict[str, str] | None:
+        """
+        Return {date: entry hash} from the last build, or None if there is no
+        trustworthy record: pages from a build predating pages.json, or from
+        an older template/renderer (e.g. before link titles were escaped),
+        must all be rewritten.
+        """
+        try:
+            data = orjson.loads(self.pages_cache_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Ignoring unreadable build cache %s: %s", self.pages_cache_path, e)
+            return None
+        return data.get("pages", {}) if data.get("version") == _PAGE_CACHE_VERSION else None
+
+    @staticmethod
+    def _entry_hash(entry: dict) -> str:
+        return hashlib.sha256(orjson.dumps(entry, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+    def _render_sections(self, entry: dict) -> tuple[str, str, str]:
+        """
+        Return the (Pure Signal, HN, Maranello) section HTML for a day.
+
+        Each day keeps its own cache file, keyed on a hash of the section
+        source, so a build only reads and writes the days it renders.
+        """
+        cache_path = self.render_cache_dir / f"{entry.get('date', 'unknown')}.json"
+        cached = self._read_cache_file(cache_path, _RENDER_CACHE_VERSION, "html")
+        html: dict[str, str] = {}
+
+        def render(kind: str, source: str, fn) -> str:
+            key = hashlib.sha256(f"{kind}\0{source}".encode("utf-8")).hexdigest()
+            html[key] = cached[key] if key in cached else fn()
+            return html[key]
+
+        pure_signal_md = entry.get("pure_signal", "")
+        hn_signal_md = entry.get("hn_signal", "")
+        maranello = entry.get("maranello", {})
+
+        ps_html = (
+            render("md", pure_signal_md, lambda: self._md_to_html(pure_signal_md))
+            if pure_signal_md else '<p class="quiet-day">No AI digest today.</p>'
+        )
+        hn_html = (
+            render("md", hn_signal_md, lambda: self._md_to_html(hn_signal_md))
+            if hn_signal_md else '<p class="quiet-day">No HN digest today.</p>'
+        )
+        mar_html = render(
+            "maranello",
+            orjson.dumps(maranello, option=orjson.OPT_SORT_KEYS).decode("utf-8"),
+            lambda: self._maranello_to_html(maranello),
+        )
+
+        if html != cached:
+            self._write_cache_file(cache_path, {"version": _RENDER_CACHE_VERSION, "html": html})
+        return ps_html, hn_html, mar_html
 
     def _copy_apple_touch_icon(self) -> None:
         if _APPLE_TOUCH_ICON_SRC.exists():
@@ -123,14 +434,11 @@ class SiteBuilder:
     # ------ Markdown → HTML (Pure Signal) ------
 
     def _md_to_html(self, md: str) -> str:
-        html = md
-        html = html.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        html = re.sub(r"^---+\s*$", "<hr>", html, flags=re.MULTILINE)
-        html = re.sub(r"^### (.+)$", r"<h3>\1</h3>", html, flags=re.MULTILINE)
-        html = re.sub(r"^## (.+)$", r"<h2>\1</h2>", html, flags=re.MULTILINE)
-        html = re.sub(r"^# (.+)$", r"<h1>\1</h1>", html, flags=re.MULTILINE)
-        html = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", html)
-        html = re.sub(r"\*(.+?)\*", r"<em>\1</em>", html)
+        html = escape(md, quote=False)
+        html = _MD_HR_RE.sub("<hr>", html)
+        html = _MD_HEADER_RE.sub(_md_header, html)
+        html = _MD_BOLD_RE.sub(r"<strong>\1</strong>", html)
+        html = _MD_ITALIC_RE.sub(r"<em>\1</em>", html)
         html = html.replace("—", "&mdash;")
         parts = []
         for p in html.split("\n\n"):
@@ -153,17 +461,19 @@ class SiteBuilder:
             return '<p class="quiet-day">No Ferrari news today.</p>'
 
         # Escape and paragraph-wrap the briefing text
-        escaped = briefing.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        escaped = briefing.translate(_HTML_ESCAPE_TABLE)
         paragraphs = [
-            f"<p>{p.strip()}</p>"
-            for p in escaped.split("\n\n")
-            if p.strip()
+            f"<p>{para}</p>"
+            for p in _PARAGRAPH_SPLIT_RE.split(escaped)
+            if (para := p.strip())
         ]
         html = "\n".join(paragraphs)
 
         if source_links:
+            # Titles and URLs come from third-party feeds, so escape both
             items = "".join(
-                f'<li><a href="{lnk["url"]}" target="_blank" rel="noopener">{lnk["title"]}</a></li>'
+                f'<li><a href="{escape(lnk["url"])}" target="_blank" rel="noopener">'
+                f'{lnk["title"].translate(_HTML_ESCAPE_TABLE)}</a></li>'
                 for lnk in source_links
             )
             html += f'\n<div class="source-links"><h4>Sources</h4><ul>{items}</ul></div>'
@@ -172,99 +482,54 @@ class SiteBuilder:
 
     # ------ Page assembly ------
 
-    def _day_body(self, entry: dict) -> str:
-        date_str = entry.get("date", "")
-        date_display = self._format_date(date_str)
-
-        pure_signal_md = entry.get("pure_signal", "")
-        hn_signal_md = entry.get("hn_signal", "")
-        maranello = entry.get("maranello", {})
-
-        ps_html = self._md_to_html(pure_signal_md) if pure_signal_md else '<p class="quiet-day">No AI digest today.</p>'
-        hn_html = self._md_to_html(hn_signal_md) if hn_signal_md else '<p class="quiet-day">No HN digest today.</p>'
-        mar_html = self._maranello_to_html(maranello)
-
-        return f"""    <time>{date_display}</time>
-
-    <section class="section pure-signal-section">
-      <h2 class="section-title pure-signal-title">
-        <span class="dot ps-dot"></span> Pure Signal
-        <span class="section-sub">AI Intelligence</span>
-      </h2>
-      <div class="section-body">
-{ps_html}
-      </div>
-    </section>
+    def _day_body_parts(self, entry: dict) -> list[bytes]:
+        date_display = self._format_date(entry.get("date", ""))
+        ps_html, hn_html, mar_html = self._render_sections(entry)
 
-    <section class="section hn-signal-section">
-      <h2 class="section-title hn-signal-title">
-        <span class="dot hn-dot"></span> HN Signal
-        <span class="section-sub">Hacker News</span>
-      </h2>
-      <div class="section-body">
-{hn_html}
-      </div>
-    </section>
-
-    <section class="section maranello-section">
-      <h2 class="section-title maranello-title">
-        <span class="dot mar-dot"></span> Maranello Signal
-        <span class="section-sub">Ferrari F1</span>
-      </h2>
-      <div class="section-body">
-{mar_html}
-      </div>
-    </section>"""
+        return [
+            f"    <time>{date_display}</time>\n".encode("utf-8"),
+            _PS_SECTION_OPEN, ps_html.encode("utf-8"),
+            _HN_SECTION_OPEN, hn_html.encode("utf-8"),
+            _MAR_SECTION_OPEN, mar_html.encode("utf-8"),
+            _SECTION_CLOSE,
+        ]
 
-    def _html_page(self, title: str, body: str, css_path: str = "style.css") -> str:
-        return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8">
-  <meta name="viewport" content="width=device-width, initial-scale=1">
-  <title>{title}</title>
-  <link rel="apple-touch-icon" href="/apple-touch-icon.jpg">
-  <link rel="stylesheet" href="{css_path}">
-</head>
-<body>
-  <nav>
-    <a href="/" class="nav-brand">Signal Hub</a>
-    <a href="/archive/">Archive</a>
-  </nav>
-  <main>
-{body}
-  </main>
-</body>
-</html>"""
+    def _write_page(
+        self,
+        path: Path,
+        title: str,
+        body_parts: list[bytes],
+        css_path: str = "style.css",
+    ) -> None:
+        """Write a page shell around body_parts without joining them into one string first."""
+        head = _PAGE_HEAD.format(title=title, css_path=css_path).encode("utf-8")
+        _write_parts(path, [head, *body_parts, _PAGE_FOOT])
 
     def _build_index(self, latest_entry: dict) -> None:
-        body = self._day_body(latest_entry)
-        page = self._html_page("Signal Hub", body)
-        (self.site_dir / "index.html").write_text(page, encoding="utf-8")
+        self._write_page(self.site_dir / "index.html", "Signal Hub", self._day_body_parts(latest_entry))
         logger.info("Built index.html")
 
     def _build_day_page(self, entry: dict, css_path: str = "../style.css") -> None:
         date_str = entry.get("date", "unknown")
         date_display = self._format_date(date_str)
-        body = self._day_body(entry)
-        title = f"Signal Hub — {date_display}"
-        page = self._html_page(title, body, css_path=css_path)
-        (self.site_dir / "archive" / f"{date_str}.html").write_text(page, encoding="utf-8")
-
-    def _build_archive_index(self, entries: list[dict]) -> None:
+        self._write_page(
+            self.site_dir / "archive" / f"{date_str}.html",
+            f"Signal Hub — {date_display}",
+            self._day_body_parts(entry),
+            css_path=css_path,
+        )
+
+    def _build_archive_index(self, summaries: list[tuple[str, dict]]) -> None:
+        """Write archive/index.html from (date_str, _entry_summary()) pairs, newest-first."""
         items = []
-        for entry in entries:
-            date_str = entry.get("date", "")
+        for date_str, summary in summaries:
             date_display = self._format_date(date_str)
-            has_ps = bool(entry.get("pure_signal", "").strip())
-            has_hn = bool(entry.get("hn_signal", "").strip())
-            has_mar = bool(entry.get("maranello", {}).get("briefing", "").strip())
             badges = ""
-            if has_ps:
+            if summary["has_ps"]:
                 badges += '<span class="badge ps-badge">AI</span>'
-            if has_hn:
+            if summary["has_hn"]:
                 badges += '<span class="badge hn-badge">HN</span>'
-            if has_mar:
+            if summary["has_mar"]:
                 badges += '<span class="badge mar-badge">F1</span>'
             items.append(
                 f'    <li>'
@@ -275,12 +540,28 @@ class SiteBuilder:
 
         list_html = "\n".join(items) if items else "    <li>No digests yet.</li>"
         body = f"    <h1>Archive</h1>\n    <ul class=\"archive-list\">\n{list_html}\n    </ul>"
-        page = self._html_page("Signal Hub — Archive", body, css_path="../style.css")
-        (self.site_dir / "archive" / "index.html").write_text(page, encoding="utf-8")
-        logger.info("Built archive index (%d entries)", len(entries))
+        self._write_page(
+            self.site_dir / "archive" / "index.html",
+            "Signal Hub — Archive",
+            [body.encode("utf-8")],
+            css_path="../style.css",
+        )
+        logger.info("Built archive index (%d entries)", len(summaries))
 
     def _write_css(self) -> None:
-        css = """\
+        # Leave an identical file untouched so its mtime (and CDN caching) survives
+        target = self.site_dir / "style.css"
+        if target.exists() and target.read_bytes() == _CSS_BYTES:
+            return
+        target.write_bytes(_CSS_BYTES)
+        logger.info("Wrote style.css")
+
+
+# ----------------------------------------------------------------------
+# Stylesheet
+# ----------------------------------------------------------------------
+
+_CSS = """\
 :root {
   --bg:       #fafaf9;
   --fg:       #1c1917;
@@ -448,5 +729,4 @@ h1 {
   .section-title { font-size: 0.95rem; }
 }
 """
-        (self.site_dir / "style.css").write_text(css, encoding="utf-8")
-        logger.info("Wrote style.css")
+_CSS_BYTES = _CSS.encode("utf-8")
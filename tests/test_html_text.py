@@ -0,0 +1,10 @@
+from src.pure_signal.fetchers.html_text import clean_html
+
+
+def test_fragment_rooted_at_stripped_tag_is_empty():
+    assert clean_html("<nav>menu</nav>") == ""
+    assert clean_html("<script>x()</script>") == ""
+
+
+def test_stripped_tags_removed_from_mixed_fragment():
+    assert clean_html("<nav>menu</nav><p>body</p>") == "body"